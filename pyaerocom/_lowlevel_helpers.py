@@ -11,11 +11,20 @@ from pathlib import Path
 import numpy as np
 import simplejson
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from pyaerocom._warnings import ignore_warnings
 
 logger = logging.getLogger(__name__)
 
 
+#: float types that are rounded in :func:`round_floats`
+_FLOAT_TYPES = (float, np.floating)
+
+
 def round_floats(in_data, precision=5):
     """
     simple helper method to change all floats of a data structure to a given precision.
@@ -35,7 +44,7 @@ def round_floats(in_data, precision=5):
 
     """
 
-    if isinstance(in_data, (float, np.float32, np.float16, np.float128, np.float64)):
+    if isinstance(in_data, _FLOAT_TYPES):
         # np.float64, is an aliase for the Python float, but is mentioned here for completeness
         # note that round and np.round yield different results with the Python round being mathematically correct
         # details are here:
@@ -62,14 +71,52 @@ def read_json(file_path):
     dict
         content as dictionary
     """
-    with open(file_path) as f:
-        data = simplejson.load(f)
-    return data
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN values, which are not supported by orjson
+    return simplejson.loads(raw)
+
+
+#: input args of :func:`write_json` that are supported when writing with orjson
+_ORJSON_KWARGS = {"ignore_nan", "indent"}
+
+#: indentations supported by orjson (None: no indentation)
+_ORJSON_INDENTS = (None, 2)
+
+
+def _orjson_default(obj):
+    """Convert numpy floats that orjson cannot serialise (e.g. float128)"""
+    if isinstance(obj, np.floating):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _can_write_orjson(kwargs):
+    """Check if json output for input args of :func:`write_json` can be written with orjson"""
+    return (
+        orjson is not None
+        and kwargs.keys() <= _ORJSON_KWARGS
+        and kwargs.get("ignore_nan") is True
+        and kwargs.get("indent") in _ORJSON_INDENTS
+    )
 
 
 def write_json(data_dict, file_path, **kwargs):
     """Save json file
 
+    Note
+    ----
+    If `orjson <https://github.com/ijl/orjson>`_ is installed and orjson
+    can produce the same output as :func:`simplejson.dump` for the input
+    args, the file is written using orjson, which is considerably faster.
+    This is the case if ``ignore_nan=True`` (orjson always writes NaNs as
+    null) and `indent` is either not set or 2 (the only indentation orjson
+    supports). Otherwise simplejson is used.
+
     Parameters
     ----------
     data_dict : dict
@@ -80,8 +127,16 @@ def write_json(data_dict, file_path, **kwargs):
         additional keyword args passed to :func:`simplejson.dumps` (e.g.
         indent, )
     """
+    data_dict = round_floats(data_dict)
+    if _can_write_orjson(kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent") is not None:
+            option |= orjson.OPT_INDENT_2
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data_dict, default=_orjson_default, option=option))
+        return
     with open(file_path, "w") as f:
-        simplejson.dump(round_floats(data_dict), f, **kwargs)
+        simplejson.dump(data_dict, f, **kwargs)
 
 
 def check_make_json(fp, indent=4):
@@ -153,8 +208,14 @@ def check_dir_access(path, timeout=0.1):
         return False
     pool = ThreadPoolExecutor()
 
+    def _read_first_entry(testdir):
+        # only the first entry is read, listing large directories (e.g. on
+        # network file systems) may take long
+        with os.scandir(testdir) as entries:
+            next(entries, None)
+
     def try_ls(testdir, timeout):
-        future = pool.submit(os.listdir, testdir)
+        future = pool.submit(_read_first_entry, testdir)
         try:
             future.result(timeout)
             return True
@@ -302,10 +363,11 @@ class DictStrKeysListVals(Validator):
     def validate(self, val: dict):
         if not isinstance(val, dict):
             raise ValueError(f"need dict, got {val}")
-        if any(not isinstance(x, str) for x in val):
-            raise ValueError(f"all keys need to be str type in {val}")
-        if any(not isinstance(x, list) for x in val.values()):
-            raise ValueError(f"all values need to be list type in {val}")
+        for key, item in val.items():
+            if not isinstance(key, str):
+                raise ValueError(f"all keys need to be str type in {val}")
+            if not isinstance(item, list):
+                raise ValueError(f"all values need to be list type in {val}")
         return val
 
 
@@ -399,7 +461,7 @@ class BrowseDict(MutableMapping):
     """
 
     ADD_GLOB = []
-    FORBIDDEN_KEYS = []
+    FORBIDDEN_KEYS = frozenset()
     #: Keys to be ignored when converting to json
     IGNORE_JSON = []
     MAXLEN_KEYS = 1e2
@@ -431,11 +493,15 @@ class BrowseDict(MutableMapping):
             return
         if bool(self.SETTER_CONVERT):
             for fromtp, totp in self.SETTER_CONVERT.items():
-                if isinstance(val, fromtp):
+                if isinstance(val, totp):
+                    # already converted, no need to re-instantiate
+                    break
+                elif isinstance(val, fromtp):
                     if fromtp == dict:
                         val = totp(**val)
                     else:
                         val = totp(val)
+                    break
 
         if isinstance(key, str):
             if len(key) > self.MAXLEN_KEYS:
@@ -564,12 +630,21 @@ class ConstrainedContainer(BrowseDict):
     def _invoke_dtype(self, current_tp, val):
         return current_tp(**val)
 
-    def _check_valtype(self, key, val):
-        current_tp = type(self[key])
-        if type(val) != current_tp and isinstance(self[key], BrowseDict):
+    def _check_valtype(self, key, val, current=None):
+        if current is None:
+            current = self[key]
+        current_tp = type(current)
+        if type(val) != current_tp and isinstance(current, BrowseDict):
             val = current_tp(**val)
         return val
 
+    def _is_valid_key(self, key) -> bool:
+        # equivalent to key in dir(self), without building the sorted
+        # attribute list on every assignment
+        if not isinstance(key, str):
+            return False
+        return key in self.__dict__ or hasattr(type(self), key)
+
     def _setitem_checker(self, key, val):
         """make sure no new attr is added
 
@@ -577,14 +652,14 @@ class ConstrainedContainer(BrowseDict):
         ----
         Only used in __setitem__ not in __setattr__.
         """
-        if not key in dir(self):
+        if not self._is_valid_key(key):
             if self.CRASH_ON_INVALID:
                 raise ValueError(f"Invalid key {key}")
             logger.warning(f"Invalid key {key} in {self._class_name}. Will be ignored.")
             return key, val, False
 
         current = getattr(self, key)
-        val = self._check_valtype(key, val)
+        val = self._check_valtype(key, val, current)
         current_tp = type(current)
 
         if not current is None and not isinstance(val, current_tp):
@@ -721,20 +796,26 @@ def merge_dicts(dict1, dict2, discard_failing=True):
 def chk_make_subdir(base, name):
     """Check if sub-directory exists in parent directory"""
     d = os.path.join(base, name)
-    if not os.path.exists(d):
+    try:
         os.mkdir(d)
+    except FileExistsError:
+        pass
     return d
 
 
 def check_dirs_exist(*dirs, **add_dirs):
     for d in dirs:
-        if not os.path.exists(d):
-            print(f"Creating dir: {d}")
+        try:
             os.mkdir(d)
+        except FileExistsError:
+            continue
+        print(f"Creating dir: {d}")
     for k, d in add_dirs.items():
-        if not os.path.exists(d):
+        try:
             os.mkdir(d)
-            print(f"Creating dir: {d} ({k})")
+        except FileExistsError:
+            continue
+        print(f"Creating dir: {d} ({k})")
 
 
 def list_to_shortstr(lst, indent=0):
@@ -786,13 +867,9 @@ def sort_dict_by_name(d, pref_list: list = None) -> dict:
     """
     if pref_list is None:
         pref_list = []
-    s = {}
-    sorted_keys = sorted(d)
-    for k in pref_list:
-        if k in d:
-            s[k] = d[k]
-    for k in sorted_keys:
-        if not k in pref_list:
+    s = {k: d[k] for k in pref_list if k in d}
+    for k in sorted(d):
+        if not k in s:
             s[k] = d[k]
     return s
 
@@ -1,6 +1,6 @@
 import abc
+import os
 
-from pyaerocom._lowlevel_helpers import TypeValidator
 from pyaerocom.aeroval import EvalSetup
 from pyaerocom.aeroval.experiment_output import ExperimentOutput
 from pyaerocom.colocation_auto import Colocator
@@ -19,13 +19,16 @@ class HasConfig:
 
     """
 
-    cfg = TypeValidator(EvalSetup)
-    exp_output = TypeValidator(ExperimentOutput)
-
     def __init__(self, cfg: EvalSetup):
+        if not isinstance(cfg, EvalSetup):
+            raise ValueError(f"need instance of {EvalSetup}")
         self.cfg = cfg
         self.exp_output = ExperimentOutput(cfg)
 
+        # cached result of HasColocator._get_coldata_dir
+        self._coldata_dir = None
+        self._coldata_dir_key = None
+
     @property
     def raise_exceptions(self):
         return self.cfg.colocation_opts.raise_exceptions
@@ -74,7 +77,7 @@ class HasColocator(HasConfig):
     Config class that also has the ability to co-locate
     """
 
-    def _get_diurnal_only(self, obs_name):
+    def _get_diurnal_only(self, obs_name, entry=None):
         """
         Check if colocated data is flagged for only diurnal processing
 
@@ -82,20 +85,37 @@ class HasColocator(HasConfig):
         ----------
         obs_name : string
             Name of observational subset
-        colocated_data : ColocatedData
-            A ColocatedData object that will be checked for suitability of
-            diurnal processing.
+        entry : dict, optional
+            obs entry of `obs_name`, if already available. If None, it is
+            retrieved from :attr:`cfg`.
 
         Returns
         -------
         diurnal_only : bool
         """
-        entry = self.cfg.get_obs_entry(obs_name)
-        try:
-            diurnal_only = entry["diurnal_only"]
-        except KeyError:
-            diurnal_only = False
-        return diurnal_only
+        if entry is None:
+            entry = self.cfg.get_obs_entry(obs_name)
+        return entry.get("diurnal_only", False)
+
+    def _get_coldata_dir(self) -> str:
+        """
+        Get output directory for colocated data files
+
+        The path is only re-computed if the project / experiment location of
+        :attr:`cfg` has changed since the last call. The directory is created
+        if it does not exist.
+
+        Returns
+        -------
+        str
+        """
+        pm = self.cfg.path_manager
+        key = (pm.coldata_basedir, pm.proj_id, pm.exp_id)
+        if self._coldata_dir is None or key != self._coldata_dir_key:
+            self._coldata_dir = pm.get_coldata_dir(assert_exists=False)
+            self._coldata_dir_key = key
+        os.makedirs(self._coldata_dir, exist_ok=True)
+        return self._coldata_dir
 
     def get_colocator(self, model_name: str = None, obs_name: str = None) -> Colocator:
         """
@@ -117,12 +137,11 @@ class HasColocator(HasConfig):
         if obs_name:
             obs_cfg = self.cfg.get_obs_entry(obs_name)
             col.import_from(obs_cfg)
-            col.add_glob_meta(diurnal_only=self._get_diurnal_only(obs_name))
+            col.add_glob_meta(diurnal_only=self._get_diurnal_only(obs_name, entry=obs_cfg))
         if model_name:
             mod_cfg = self.cfg.get_model_entry(model_name)
             col.import_from(mod_cfg)
-        outdir = self.cfg.path_manager.get_coldata_dir()
-        col.basedir_coldata = outdir
+        col.basedir_coldata = self._get_coldata_dir()
         return col
 
 
@@ -141,7 +160,7 @@ class DataImporter(HasColocator):
 
     """
 
-    def read_model_data(self, model_name, var_name):
+    def read_model_data(self, model_name, var_name, col=None):
         """
         Import model data
 
@@ -151,6 +170,9 @@ class DataImporter(HasColocator):
             Name of model in :attr:`cfg`,
         var_name : str
             Name of variable to be read.
+        col : Colocator, optional
+            colocation engine for `model_name` (cf. :func:`get_colocator`)
+            that is re-used for reading. If None, a new one is created.
 
         Returns
         -------
@@ -158,11 +180,40 @@ class DataImporter(HasColocator):
             loaded model data.
 
         """
-        col = self.get_colocator(model_name=model_name)
+        if col is None:
+            col = self.get_colocator(model_name=model_name)
         data = col.get_model_data(var_name)
 
         return data
 
+    def read_model_data_batch(self, model_name, var_names):
+        """
+        Import multiple model variables
+
+        All variables are read with the same :class:`Colocator` (and thus the
+        same model reader instance), so that readers which keep their data
+        files open (e.g. the EMEP reader) only need to open files that contain
+        several of the variables once.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of model in :attr:`cfg`,
+        var_names : list
+            Names of variables to be read.
+
+        Returns
+        -------
+        dict
+            loaded model data (values, instances of :class:`GriddedData`) for
+            each input variable (keys).
+
+        """
+        if isinstance(var_names, str):
+            var_names = [var_names]
+        col = self.get_colocator(model_name=model_name)
+        return {var: self.read_model_data(model_name, var, col=col) for var in var_names}
+
     def read_ungridded_obsdata(self, obs_name, var_name):
         """
         Import ungridded observation data
@@ -179,6 +230,15 @@ class DataImporter(HasColocator):
         data : UngriddedData
             loaded obs data.
 
+        Note
+        ----
+        The raw data is read via :class:`ReadUngridded`, which stores
+        and re-uses pickled :class:`UngriddedData` objects for each
+        observation network and variable (cf. :class:`CacheHandlerUngridded`
+        and :attr:`Config.CACHING`), so parsing of the original data files
+        is only done if the cache is missing or outdated. Filters and outlier
+        removal specified in the obs entry are applied on top of that.
+
         """
 
         col = self.get_colocator(obs_name=obs_name)
@@ -87,7 +87,7 @@ class ColdataToJsonEngine(ProcessingEngine):
         main_freq = self.cfg.time_cfg.main_freq
         annual_stats_constrained = self.cfg.statistics_opts.annual_stats_constrained
 
-        out_dirs = self.cfg.path_manager.get_json_output_dirs(True)
+        out_dirs = self.exp_output.out_dirs_json
         regions_json = self.exp_output.regions_file
         regions_how = self.cfg.webdisp_opts.regions_how
 
@@ -129,18 +129,10 @@ def _add_heatmap_entry_json(
         current = read_json(heatmap_file)
     else:
         current = {}
-    if not var_name_web in current:
-        current[var_name_web] = {}
-    ov = current[var_name_web]
-    if not obs_name in ov:
-        ov[obs_name] = {}
-    on = ov[obs_name]
-    if not vert_code in on:
-        on[vert_code] = {}
-    ovc = on[vert_code]
-    if not model_name in ovc:
-        ovc[model_name] = {}
-    mn = ovc[model_name]
+    ov = current.setdefault(var_name_web, {})
+    on = ov.setdefault(obs_name, {})
+    ovc = on.setdefault(vert_code, {})
+    mn = ovc.setdefault(model_name, {})
     mn[model_var] = result
     write_json(current, heatmap_file, ignore_nan=True)
 
@@ -318,8 +310,6 @@ def _create_diurnal_weekly_data_object(coldata, resolution):
 
 
     """
-    import xarray as xr
-
     data_allyears = coldata.data
 
     yearkeys = list(data_allyears.groupby("time.year").groups)
@@ -840,8 +830,7 @@ def _process_map_and_scat(
                     except (DataCoverageError, TemporalResolutionError):
                         use_dummy = True
                 for i, map_stat in zip(site_indices, map_data):
-                    if not freq in map_stat:
-                        map_stat[freq] = {}
+                    map_stat.setdefault(freq, {})
 
                     if use_dummy:
                         stats = stats_dummy
@@ -1,5 +1,5 @@
 import abc
-from fnmatch import fnmatch
+import fnmatch
 
 from pyaerocom._lowlevel_helpers import BrowseDict
 from pyaerocom.aeroval.modelentry import ModelEntry
@@ -14,7 +14,7 @@ class BaseCollection(BrowseDict, abc.ABC):
     FORBIDDEN_CHARS_KEYS = ["_"]
 
     def _check_entry_name(self, key):
-        if any([x in key for x in self.FORBIDDEN_CHARS_KEYS]):
+        if any(x in key for x in self.FORBIDDEN_CHARS_KEYS):
             raise EvalEntryNameError(
                 f"Invalid name: {key}. Must not contain any of the following "
                 f"characters: {self.FORBIDDEN_CHARS_KEYS}"
@@ -22,8 +22,9 @@ class BaseCollection(BrowseDict, abc.ABC):
 
     def __setitem__(self, key, value):
         self._check_entry_name(key)
-        if "web_interface_name" in value:
-            self._check_entry_name(value["web_interface_name"])
+        web_iface_name = value.get("web_interface_name")
+        if web_iface_name is not None:
+            self._check_entry_name(web_iface_name)
         super().__setitem__(key, value)
 
     def keylist(self, name_or_pattern: str = None) -> list:
@@ -45,13 +46,14 @@ class BaseCollection(BrowseDict, abc.ABC):
         KeyError
             if no matches can be found
         """
-        if name_or_pattern is None:
+        if name_or_pattern is None and len(self) > 0:
+            # all keys match, no need to go through fnmatch
+            return list(self.keys())
+        elif name_or_pattern is None:
             name_or_pattern = "*"
 
-        matches = []
-        for key in self.keys():
-            if fnmatch(key, name_or_pattern) and not key in matches:
-                matches.append(key)
+        # pattern is translated only once, keys are unique anyway
+        matches = fnmatch.filter(self.keys(), name_or_pattern)
         if len(matches) == 0:
             raise KeyError(f"No matches could be found that match input {name_or_pattern}")
         return matches
@@ -122,10 +124,7 @@ class ObsCollection(BaseCollection):
             list of variables specified in obs collection
 
         """
-        vars = []
-        for ocfg in self.values():
-            vars.extend(ocfg.get_all_vars())
-        return sorted(list(set(vars)))
+        return sorted({var for ocfg in self.values() for var in ocfg.get_all_vars()})
 
     def get_web_iface_name(self, key):
         """
@@ -148,10 +147,7 @@ class ObsCollection(BaseCollection):
             corresponding name
 
         """
-        entry = self[key]
-        if not "web_interface_name" in entry:
-            return key
-        return entry["web_interface_name"]
+        return self[key].get("web_interface_name", key)
 
     @property
     def web_iface_names(self) -> list:
@@ -162,7 +158,7 @@ class ObsCollection(BaseCollection):
         -------
         list
         """
-        return [self.get_web_iface_name(key) for key in self.keylist()]
+        return [entry.get("web_interface_name", key) for key, entry in self.items()]
 
     @property
     def all_vert_types(self):
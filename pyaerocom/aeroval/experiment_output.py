@@ -1,7 +1,8 @@
-import glob
 import logging
 import os
+import re
 import shutil
+from functools import lru_cache
 
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import (
@@ -29,6 +30,19 @@ from pyaerocom.variable_helpers import get_aliases
 
 logger = logging.getLogger(__name__)
 
+#: filename convention of json files in map subdirectory (without .json
+#: extension): <obsname>-<obsvar>_<vertcode>_<modname>-<modvar>_<period>
+_MAP_FILE_PATTERN = re.compile(r"(?:([^_]*)-)?([^_-]*)_([^_]*)_(?:([^_]*)-)?([^_-]*)_([^_]*)")
+
+
+@lru_cache(maxsize=16384)
+def _parse_map_filename(fname):
+    """Meta info tuple of map json filename or None if name is invalid"""
+    match = _MAP_FILE_PATTERN.fullmatch(fname.split(".json")[0])
+    if match is None:
+        return None
+    return match.groups("")
+
 
 class ProjectOutput:
     """JSON output for project"""
@@ -44,8 +58,11 @@ class ProjectOutput:
     def proj_dir(self):
         """Project directory"""
         fp = os.path.join(self.json_basedir, self.proj_id)
-        if not os.path.exists(fp):
+        try:
             os.mkdir(fp)
+        except FileExistsError:
+            pass
+        else:
             logger.info(f"Creating AeroVal project directory at {fp}")
         return fp
 
@@ -123,6 +140,10 @@ class ExperimentOutput(ProjectOutput):
         # invalid or outdated json files across different output directories
         self._invalid = dict(models=[], obs=[])
 
+        # json output directories, see out_dirs_json
+        self._out_dirs_json = None
+        self._out_dirs_json_key = None
+
     @property
     def exp_id(self):
         """Experiment ID"""
@@ -132,8 +153,11 @@ class ExperimentOutput(ProjectOutput):
     def exp_dir(self):
         """Experiment directory"""
         fp = os.path.join(self.proj_dir, self.exp_id)
-        if not os.path.exists(fp):
+        try:
             os.mkdir(fp)
+        except FileExistsError:
+            pass
+        else:
             logger.info(f"Creating AeroVal experiment directory at {fp}")
         return fp
 
@@ -170,18 +194,33 @@ class ExperimentOutput(ProjectOutput):
         """
         bool: True if results are available for this experiment, else False
         """
-        if not self.exp_id in os.listdir(self.proj_dir):
+        if not os.path.isdir(os.path.join(self.proj_dir, self.exp_id)):
             return False
-        elif not len(self._get_json_output_files("map")) > 0:
-            return False
-        return True
+        with os.scandir(self.out_dirs_json["map"]) as entries:
+            return any(
+                entry.name.endswith(".json") and not entry.name.startswith(".")
+                for entry in entries
+            )
 
     @property
     def out_dirs_json(self) -> dict:
         """
         json output directories (`dict`)
+
+        The directories are only re-initialised (via the path manager of
+        :attr:`cfg`) if the output location has changed or the experiment
+        directory was removed in the meantime.
         """
-        return self.cfg.path_manager.get_json_output_dirs()
+        pm = self.cfg.path_manager
+        key = (pm.json_basedir, pm.proj_id, pm.exp_id)
+        if (
+            self._out_dirs_json is None
+            or key != self._out_dirs_json_key
+            or not os.path.isdir(os.path.join(*key))
+        ):
+            self._out_dirs_json = pm.get_json_output_dirs()
+            self._out_dirs_json_key = key
+        return dict(self._out_dirs_json)
 
     def update_menu(self):
         """Update menu
@@ -189,18 +228,16 @@ class ExperimentOutput(ProjectOutput):
         The menu.json file is created based on the available json map files in the
         map directory of an experiment.
 
-        Parameters
-        ----------
-        menu_file : str
-            path to json menu file
-        delete_mode : bool
-            if True, then no attempts are being made to find json files for the
-            experiment specified in `config`.
+        Returns
+        -------
+        dict
+            content of the updated menu.json file
 
         """
         avail = self._create_menu_dict()
         avail = self._sort_menu_entries(avail)
         write_json(avail, self.menu_file, indent=4)
+        return avail
 
     def update_interface(self) -> None:
         """
@@ -227,8 +264,8 @@ class ExperimentOutput(ProjectOutput):
         exp_data = {"public": self.cfg.exp_info.public}
         self._add_entry_experiments_json(self.exp_id, exp_data)
         self._create_var_ranges_json()
-        self.update_menu()
-        self._sync_heatmaps_with_menu_and_regions()
+        menu = self.update_menu()
+        self._sync_heatmaps_with_menu_and_regions(menu)
 
         self._create_statistics_json()
         # AeroVal frontend needs periods to be set in config json file...
@@ -236,37 +273,44 @@ class ExperimentOutput(ProjectOutput):
         self.cfg._check_time_config()
         self.cfg.to_json(self.exp_dir)
 
-    def _sync_heatmaps_with_menu_and_regions(self):
+    def _sync_heatmaps_with_menu_and_regions(self, menu: dict = None):
         """
         Synchronise content of heatmap json files with content of menu.json
+
+        Parameters
+        ----------
+        menu : dict, optional
+            content of menu.json, e.g. as returned by :func:`update_menu`. If
+            None, the menu is read from :attr:`menu_file`.
         """
-        menu = read_json(self.menu_file)
+        if menu is None:
+            menu = read_json(self.menu_file)
         all_regions = read_json(self.regions_file)
         for fp in self._get_json_output_files("hm"):
             data = read_json(fp)
+            # keys at each level of the menu are unique, so the sub-dicts of
+            # hm can be created directly while walking the menu
             hm = {}
             for vardisp, info in menu.items():
-                obs_dict = info["obs"]
-                if not vardisp in hm:
-                    hm[vardisp] = {}
-                for obs, vdict in obs_dict.items():
-                    if not obs in hm[vardisp]:
-                        hm[vardisp][obs] = {}
+                hm_var = hm[vardisp] = {}
+                data_var = data[vardisp]
+                for obs, vdict in info["obs"].items():
+                    hm_obs = hm_var[obs] = {}
+                    data_obs = data_var[obs]
                     for vc, mdict in vdict.items():
-                        if not vc in hm[vardisp][obs]:
-                            hm[vardisp][obs][vc] = {}
+                        hm_vc = hm_obs[vc] = {}
+                        data_vc = data_obs[vc]
                         for mod, minfo in mdict.items():
-                            if not mod in hm[vardisp][obs][vc]:
-                                hm[vardisp][obs][vc][mod] = {}
                             modvar = minfo["model_var"]
-                            hm_data = data[vardisp][obs][vc][mod][modvar]
-                            hm_data = self._check_hm_all_regions_avail(all_regions, hm_data)
-                            hm[vardisp][obs][vc][mod][modvar] = hm_data
+                            hm_data = self._check_hm_all_regions_avail(
+                                all_regions, data_vc[mod][modvar]
+                            )
+                            hm_vc[mod] = {modvar: hm_data}
 
             write_json(hm, fp, ignore_nan=True)
 
     def _check_hm_all_regions_avail(self, all_regions, hm_data):
-        if all([x in hm_data for x in all_regions]):
+        if all(x in hm_data for x in all_regions):
             return hm_data
         # some regions are not available in this subset
         periods = self.cfg.time_cfg._get_all_period_strings()
@@ -307,27 +351,14 @@ class ExperimentOutput(ProjectOutput):
         str
             name of model variable
         """
-        spl = os.path.basename(filename).split(".json")[0].split("_")
-        if len(spl) != 4:
+        info = _parse_map_filename(os.path.basename(filename))
+        if info is None:
             raise ValueError(
                 f"invalid map filename: {filename}. Must "
                 f"contain exactly 3 underscores _ to separate "
                 f"obsinfo, vertical, model info, and periods"
             )
-        obsinfo = spl[0]
-        vert_code = spl[1]
-        modinfo = spl[2]
-        per = spl[3]
-
-        mspl = modinfo.split("-")
-        mvar = mspl[-1]
-        mname = "-".join(mspl[:-1])
-
-        ospl = obsinfo.split("-")
-        ovar = ospl[-1]
-        oname = "-".join(ospl[:-1])
-
-        return (oname, ovar, vert_code, mname, mvar, per)
+        return info
 
     def _results_summary(self):
         res = [[], [], [], [], [], []]
@@ -355,7 +386,8 @@ class ExperimentOutput(ProjectOutput):
         outdirs = self.out_dirs_json
         mapfiles = self._get_json_output_files("map")
         rmmap = []
-        vert_codes = self.cfg.obs_cfg.all_vert_types
+        vert_codes = set(self.cfg.obs_cfg.all_vert_types)
+        obs_index = self._get_obs_entries_web_iface()
         for file in mapfiles:
             try:
                 (
@@ -374,37 +406,62 @@ class ExperimentOutput(ProjectOutput):
                 )
                 rmmap.append(file)
                 continue
-            if not self._is_part_of_experiment(obs_name, obs_var, mod_name, mod_var):
+            if not self._is_part_of_experiment(obs_name, obs_var, mod_name, mod_var, obs_index):
                 rmmap.append(file)
             elif not vert_code in vert_codes:
                 rmmap.append(file)
 
-        scatfiles = os.listdir(outdirs["scat"])
-        for file in rmmap:  # delete map files
+        with os.scandir(outdirs["scat"]) as entries:
+            scatfiles = {entry.name: entry.path for entry in entries}
+        rm = []
+        for file in rmmap:  # map files and corresponding scatter files
             logger.info(f"Deleting outdated map json file: {file}.")
+            rm.append(file)
+            scfp = scatfiles.get(os.path.basename(file))
+            if scfp is not None:
+                logger.info(f"Deleting outdated scatter json file: {scfp}.")
+                rm.append(scfp)
+        for file in rm:
             os.remove(file)
-            modified.append(file)
-            fname = os.path.basename(file)
-            if fname in scatfiles:
-                scfp = os.path.join(outdirs["scat"], fname)
-                logger.info(f"Deleting outdated scatter json file: {file}.")
-                os.remove(scfp)
-                modified.append(file)
+        modified.extend(rm)
 
         tsfiles = self._get_json_output_files("ts")
-
+        models_in_exp = set(self.cfg.model_cfg.web_iface_names)
         for file in tsfiles:
-            if self._check_clean_ts_file(file):
+            if self._check_clean_ts_file(file, vert_codes, models_in_exp):
                 modified.append(file)
         modified.extend(self._clean_modelmap_files())
         self.update_interface()  # will take care of heatmap data
         return modified
 
-    def _check_clean_ts_file(self, fp):
+    def _check_clean_ts_file(self, fp, vert_codes=None, models_in_exp=None):
+        """
+        Check timeseries json file and remove outdated data
+
+        Parameters
+        ----------
+        fp : str
+            path of json file in ts subdirectory.
+        vert_codes : set, optional
+            vertical codes of experiment, may be provided if this method is
+            called repeatedly. Computed if None.
+        models_in_exp : set, optional
+            web interface names of models in experiment, may be provided if
+            this method is called repeatedly. Computed if None.
+
+        Returns
+        -------
+        bool
+            True if file was modified or deleted, else False.
+        """
+        if vert_codes is None:
+            vert_codes = set(self.cfg.obs_cfg.all_vert_types)
+        if models_in_exp is None:
+            models_in_exp = set(self.cfg.model_cfg.web_iface_names)
         fname = os.path.basename(fp)
         spl = fname.split(".json")[0].split("_")
         vc, obsinfo = spl[-1], spl[-2]
-        if not vc in self.cfg.obs_cfg.all_vert_types:
+        if not vc in vert_codes:
             logger.warning(
                 f"Invalid or outdated vert code {vc} in ts file {fp}. File will be deleted."
             )
@@ -427,8 +484,7 @@ class ExperimentOutput(ProjectOutput):
             return True
 
         models_avail = list(data)
-        models_in_exp = self.cfg.model_cfg.web_iface_names
-        if all([mod in models_in_exp for mod in models_avail]):
+        if all(mod in models_in_exp for mod in models_avail):
             # nothing to clean up
             return False
         modified = False
@@ -447,9 +503,11 @@ class ExperimentOutput(ProjectOutput):
 
         # Note: to be called after cleanup of files in map subdir
         json_files = self._get_json_output_files("contour")
+        add_model_maps = self.cfg.webdisp_opts.add_model_maps
+        invalid_models = set(self._invalid["models"])
         rm = []
         for file in json_files:
-            if not self.cfg.webdisp_opts.add_model_maps:
+            if not add_model_maps:
                 rm.append(file)
             else:
                 fname = os.path.basename(file)
@@ -460,17 +518,21 @@ class ExperimentOutput(ProjectOutput):
                         msg += "Likely due to underscore being present in model or variable name."
                     rm.append(file)
                     logger.warning(msg)
-                elif spl[-1] in self._invalid["models"]:
+                elif spl[-1] in invalid_models:
                     rm.append(file)
+        if not rm:
+            return []
 
+        with os.scandir(self.out_dirs_json["contour"]) as entries:
+            existing = {entry.name for entry in entries}
         removed = []
         for file in rm:
-            os.remove(file)
             removed.append(file)
             file1 = file.replace(".json", ".geojson")
-            if os.path.exists(file1):
-                os.remove(file1)
-                removed.append(file)
+            if os.path.basename(file1) in existing:
+                removed.append(file1)
+        for file in removed:
+            os.remove(file)
         return removed
 
     def delete_experiment_data(self, also_coldata=True):
@@ -484,12 +546,6 @@ class ExperimentOutput(ProjectOutput):
 
         Parameters
         ----------
-        base_dir : str, optional
-            basic output direcory (containing subdirs of all projects)
-        proj_name : str, optional
-            name of project, if None, then this project is used
-        exp_name : str, optional
-            name experiment, if None, then this project is used
         also_coldata : bool
             if True and if output directory for colocated data is default and
             specific for input experiment ID, then also all associated colocated
@@ -498,6 +554,7 @@ class ExperimentOutput(ProjectOutput):
         if os.path.exists(self.exp_dir):
             logger.info(f"Deleting everything under {self.exp_dir}")
             shutil.rmtree(self.exp_dir)
+        self._out_dirs_json = None
 
         if also_coldata:
             coldir = self.cfg.path_manager.get_coldata_dir()
@@ -542,7 +599,12 @@ class ExperimentOutput(ProjectOutput):
 
     def _get_json_output_files(self, dirname):
         dirloc = self.out_dirs_json[dirname]
-        return glob.glob(f"{dirloc}/*.json")
+        with os.scandir(dirloc) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".")
+            ]
 
     def _get_cmap_info(self, var):
         if var in var_ranges_defaults:
@@ -606,8 +668,9 @@ class ExperimentOutput(ProjectOutput):
             variable category
 
         """
+        # experiment specific definitions take precedence over the defaults
         if var_name in self.cfg.var_web_info:
-            name, tp, cat = self.cfg.var_mapping[var_name]
+            name, tp, cat = self.cfg.var_web_info[var_name]
         elif var_name in var_web_info:
             name, tp, cat = var_web_info[var_name]
         else:
@@ -683,7 +746,23 @@ class ExperimentOutput(ProjectOutput):
                 return True
         return False
 
-    def _is_part_of_experiment(self, obs_name, obs_var, mod_name, mod_var):
+    def _get_obs_entries_web_iface(self) -> dict:
+        """
+        Get obs entries of experiment by their web interface names
+
+        Returns
+        -------
+        dict
+            keys are web interface names, values are lists of the obs entries
+            (:class:`ObsEntry`) using that name.
+        """
+        allobs = self.cfg.obs_cfg
+        index = {}
+        for key, ocfg in allobs.items():
+            index.setdefault(allobs.get_web_iface_name(key), []).append(ocfg)
+        return index
+
+    def _is_part_of_experiment(self, obs_name, obs_var, mod_name, mod_var, obs_index=None):
         """
         Check if input combination of model and obs var is valid
 
@@ -707,6 +786,9 @@ class ExperimentOutput(ProjectOutput):
             Name of model
         mod_var : str
             Name of model variable
+        obs_index : dict, optional
+            output of :func:`_get_obs_entries_web_iface`, may be provided if
+            this method is called repeatedly. Computed if None.
 
         Returns
         -------
@@ -725,11 +807,9 @@ class ExperimentOutput(ProjectOutput):
         # search obs entry (may have web_interface_name set, so have to
         # check keys of ObsCollection but also the individual entries for
         # occurence of web_interface_name).
-        allobs = self.cfg.obs_cfg
-        obs_matches = []
-        for key, ocfg in allobs.items():
-            if obs_name == allobs.get_web_iface_name(key):
-                obs_matches.append(ocfg)
+        if obs_index is None:
+            obs_index = self._get_obs_entries_web_iface()
+        obs_matches = obs_index.get(obs_name, [])
         if len(obs_matches) == 0:
             self._invalid["obs"].append(obs_name)
             # obs dataset is not part of experiment
@@ -743,26 +823,34 @@ class ExperimentOutput(ProjectOutput):
     def _create_menu_dict(self):
         new = {}
         files = self._get_json_output_files("map")
+        obs_index = self._get_obs_entries_web_iface()
+        # model entries resolved so far (many map files share the same model)
+        model_entries = {}
+        # map files of different periods and vertical codes share the same
+        # obs / model combination, which only needs to be checked once
+        valid_combinations = {}
         for file in files:
             (obs_name, obs_var, vert_code, mod_name, mod_var, per) = self._info_from_map_file(file)
 
-            if self._is_part_of_experiment(obs_name, obs_var, mod_name, mod_var):
+            combination = (obs_name, obs_var, mod_name, mod_var)
+            if not combination in valid_combinations:
+                valid_combinations[combination] = self._is_part_of_experiment(
+                    *combination, obs_index
+                )
+            if valid_combinations[combination]:
 
-                mcfg = self.cfg.model_cfg.get_entry(mod_name)
+                if not mod_name in model_entries:
+                    model_entries[mod_name] = self.cfg.model_cfg.get_entry(mod_name)
+                mcfg = model_entries[mod_name]
                 var = mcfg.get_varname_web(mod_var, obs_var)
                 if not var in new:
                     new[var] = self._init_menu_entry(var)
 
-                if not obs_name in new[var]["obs"]:
-                    new[var]["obs"][obs_name] = {}
-
-                if not vert_code in new[var]["obs"][obs_name]:
-                    new[var]["obs"][obs_name][vert_code] = {}
-                if not mod_name in new[var]["obs"][obs_name][vert_code]:
-                    new[var]["obs"][obs_name][vert_code][mod_name] = {}
+                vert_codes = new[var]["obs"].setdefault(obs_name, {})
+                models = vert_codes.setdefault(vert_code, {})
 
                 model_id = mcfg["model_id"]
-                new[var]["obs"][obs_name][vert_code][mod_name] = {
+                models[mod_name] = {
                     "model_id": model_id,
                     "model_var": mod_var,
                     "obs_var": obs_var,
@@ -795,35 +883,46 @@ class ExperimentOutput(ProjectOutput):
             AerocomEvaluation class and if not, alphabetic order is used.
 
         """
-        # sort first layer (i.e. variables)
-        avail = sort_dict_by_name(avail, pref_list=self.cfg.webdisp_opts.var_order_menu)
+        if not avail:
+            return {}
+        var_order = self.cfg.webdisp_opts.var_order_menu
+        obs_order = self.get_obs_order_menu()
+        model_order = self.get_model_order_menu()
 
         new_sorted = {}
-        for var, info in avail.items():
+        # sort first layer (i.e. variables)
+        for var, info in sort_dict_by_name(avail, pref_list=var_order).items():
+            sorted_obs = {}
+            for obs_name, vert_codes in sort_dict_by_name(info["obs"], obs_order).items():
+                sorted_obs[obs_name] = {
+                    vert_code: sort_dict_by_name(models, pref_list=model_order)
+                    for vert_code, models in sort_dict_by_name(vert_codes).items()
+                }
+            info["obs"] = sorted_obs
             new_sorted[var] = info
-            obs_order = self.get_obs_order_menu()
-            sorted_obs = sort_dict_by_name(info["obs"], pref_list=obs_order)
-            new_sorted[var]["obs"] = sorted_obs
-            for obs_name, vert_codes in sorted_obs.items():
-                vert_codes_sorted = sort_dict_by_name(vert_codes)
-                new_sorted[var]["obs"][obs_name] = vert_codes_sorted
-                for vert_code, models in vert_codes_sorted.items():
-                    model_order = self.get_model_order_menu()
-                    models_sorted = sort_dict_by_name(models, pref_list=model_order)
-                    new_sorted[var]["obs"][obs_name][vert_code] = models_sorted
         return new_sorted
 
     def _get_valid_obs_vars(self, obs_name):
-        if obs_name in self._valid_obs_vars:
-            return self._valid_obs_vars[obs_name]
-
-        obs_vars = self.obs_config[obs_name]["obs_vars"]
-        add = []
-        for mname, mcfg in self.model_config.items():
-            if "model_add_vars" in mcfg:
-                for ovar, mvar in mcfg["model_add_vars"].items():
-                    if ovar in obs_vars and not mvar in add:
-                        add.append(mvar)
-        obs_vars.extend(add)
-        self._valid_obs_vars[obs_name] = obs_vars
-        return obs_vars
+        """
+        Get all variables that are valid for a certain obs entry
+
+        Parameters
+        ----------
+        obs_name : str
+            name of obs entry in :attr:`cfg`.
+
+        Returns
+        -------
+        frozenset
+            obs variables of obs entry plus all model variables that are
+            mapped to one of them via `model_add_vars` in any model entry.
+        """
+        obs_vars = set(self.cfg.obs_cfg[obs_name]["obs_vars"])
+        add = {
+            mvar
+            for mcfg in self.cfg.model_cfg.values()
+            for ovar, mvars in mcfg.model_add_vars.items()
+            if ovar in obs_vars
+            for mvar in mvars
+        }
+        return frozenset(obs_vars | add)
@@ -49,11 +49,14 @@ class ModelEntry(BrowseDict):
 
     def __init__(self, model_id, **kwargs):
         self.model_id = model_id
-        self.model_ts_type_read = ""
-        self.model_use_vars = {}
-        self.model_add_vars = {}
-        self.model_rename_vars = {}
-        self.model_read_aux = {}
+        # defaults are valid, so no need to run them through the validators
+        self.__dict__.update(
+            model_ts_type_read="",
+            model_use_vars={},
+            model_add_vars={},
+            model_rename_vars={},
+            model_read_aux={},
+        )
 
         self.update(**kwargs)
 
@@ -38,26 +38,27 @@ class ModelMapsEngine(ProcessingEngine, DataImporter):
     def run(self, **kwargs):
         model_list, var_list = self._get_run_kwargs(**kwargs)
 
+        # variables of all obs entries, the same for all models
+        obs_vars = self.cfg.obs_cfg.get_all_vars()
         all_files = []
         for model in model_list:
             try:
-                files = self._run_model(model, var_list)
+                files = self._run_model(model, var_list, obs_vars=obs_vars)
             except VarNotAvailableError:
                 files = []
             all_files.extend(files)
-        return files
-
-    def _get_vars_to_process(self, model_name, var_list):
+        return all_files
 
-        mvars = self.cfg.model_cfg.get_entry(model_name).get_vars_to_process(
-            self.cfg.obs_cfg.get_all_vars()
-        )[1]
+    def _get_vars_to_process(self, model_name, var_list, obs_vars=None):
+        if obs_vars is None:
+            obs_vars = self.cfg.obs_cfg.get_all_vars()
+        mvars = self.cfg.model_cfg.get_entry(model_name).get_vars_to_process(obs_vars)[1]
         all_vars = sorted(list(set(mvars)))
         if var_list is not None:
             all_vars = [var for var in var_list if var in all_vars]
         return all_vars
 
-    def _run_model(self, model_name: str, var_list):
+    def _run_model(self, model_name: str, var_list, obs_vars=None):
         """Run evaluation of map processing
 
         Create json files for model-maps display. This analysis does not
@@ -72,22 +73,39 @@ class ModelMapsEngine(ProcessingEngine, DataImporter):
         var_list : list, optional
             name of variable to be processed. If None, all available
             observation variables are used.
+        obs_vars : list, optional
+            all variables of the obs entries in :attr:`cfg` (cf.
+            :func:`ObsCollection.get_all_vars`). Computed if None.
 
         """
 
-        var_list = self._get_vars_to_process(model_name, var_list)
+        var_list = self._get_vars_to_process(model_name, var_list, obs_vars)
+        col = self.get_colocator(model_name=model_name)
+        existing_files = None
+        if not self.reanalyse_existing:
+            # list output directory once instead of checking each file
+            existing_files = set(os.listdir(self.exp_output.out_dirs_json["contour"]))
         files = []
         for var in var_list:
             logger.info(f"Processing model maps for {model_name} ({var})")
 
             try:
-                _files = self._process_map_var(model_name, var, self.reanalyse_existing)
+                _files = self._process_map_var(
+                    model_name,
+                    var,
+                    self.reanalyse_existing,
+                    col=col,
+                    existing_files=existing_files,
+                )
                 files.extend(_files)
 
             except (TemporalResolutionError, DataCoverageError, VariableDefinitionError) as e:
                 if self.raise_exceptions:
                     raise
                 logger.warning(f"Failed to process maps for {model_name} {var} data. Reason: {e}.")
+            finally:
+                # do not keep model data of processed variables in memory
+                col.clear_model_data_cache(var)
         return files
 
     def _check_dimensions(self, data: GriddedData) -> "GriddedData":
@@ -99,7 +117,7 @@ class ModelMapsEngine(ProcessingEngine, DataImporter):
             data = data.extract_surface_level()
         return data
 
-    def _process_map_var(self, model_name, var, reanalyse_existing):
+    def _process_map_var(self, model_name, var, reanalyse_existing, col=None, existing_files=None):
         """
         Process model data to create map json files
 
@@ -111,6 +129,13 @@ class ModelMapsEngine(ProcessingEngine, DataImporter):
             name of variable
         reanalyse_existing : bool
             if True, already existing json files will be reprocessed
+        col : Colocator, optional
+            colocation engine used for reading of model data (cf.
+            :func:`read_model_data`).
+        existing_files : set, optional
+            names of files in the output directory of the model maps. Only
+            relevant if `reanalyse_existing` is False. If None, the output
+            files are checked individually.
 
         Raises
         ------
@@ -120,23 +145,29 @@ class ModelMapsEngine(ProcessingEngine, DataImporter):
             If the data has the incorrect number of dimensions or misses either
             of time, latitude or longitude dimension.
         """
-        data = self.read_model_data(model_name, var)
-        check_var_ranges_avail(data, var)
-        varinfo = VarinfoWeb(var)
-
-        data = self._check_dimensions(data)
-
-        outdir = self.cfg.path_manager.get_json_output_dirs()["contour"]
+        outdir = self.exp_output.out_dirs_json["contour"]
         outname = f"{var}_{model_name}"
 
         fp_json = os.path.join(outdir, f"{outname}.json")
         fp_geojson = os.path.join(outdir, f"{outname}.geojson")
 
         if not reanalyse_existing:
-            if os.path.exists(fp_json) and os.path.exists(fp_geojson):
+            if existing_files is None:
+                exists = os.path.exists(fp_json) and os.path.exists(fp_geojson)
+            else:
+                exists = (
+                    f"{outname}.json" in existing_files and f"{outname}.geojson" in existing_files
+                )
+            if exists:
                 logger.info(f"Skipping processing of {outname}: data already exists.")
                 return []
 
+        data = self.read_model_data(model_name, var, col=col)
+        check_var_ranges_avail(data, var)
+        varinfo = VarinfoWeb(var)
+
+        data = self._check_dimensions(data)
+
         freq = self.cfg.time_cfg.main_freq
         tst = TsType(data.ts_type)
         if tst < freq:
@@ -1,5 +1,8 @@
+import hashlib
+import json
 import logging
 import os
+from functools import lru_cache
 from getpass import getuser
 
 from pyaerocom import __version__, const
@@ -23,6 +26,17 @@ from pyaerocom.exceptions import AeroValConfigError
 logger = logging.getLogger(__name__)
 
 
+#: custom read methods imported from :attr:`EvalSetup.io_aux_file` (keys are
+#: file paths)
+_AUX_FUNS_CACHE = {}
+
+
+@lru_cache(maxsize=None)
+def _get_default_user() -> str:
+    """Login name of current user (looked up only once per session)"""
+    return getuser()
+
+
 class OutputPaths(ConstrainedContainer):
     """
     Setup class for output paths of json files and co-located data
@@ -72,19 +86,35 @@ class OutputPaths(ConstrainedContainer):
             self.json_basedir = json_basedir
 
     def _check_init_dir(self, loc, assert_exists):
-        if assert_exists and not os.path.exists(loc):
-            os.makedirs(loc)
+        if assert_exists:
+            os.makedirs(loc, exist_ok=True)
         return loc
 
     def get_coldata_dir(self, assert_exists=True):
         loc = os.path.join(self.coldata_basedir, self.proj_id, self.exp_id)
         return self._check_init_dir(loc, assert_exists)
 
+    def _get_existing_json_subdirs(self, base: str) -> set:
+        """Relative paths of :attr:`JSON_SUBDIRS` that already exist below `base`"""
+        existing = set()
+        for parent in {os.path.dirname(subdir) for subdir in self.JSON_SUBDIRS}:
+            try:
+                with os.scandir(os.path.join(base, parent)) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            existing.add(os.path.join(parent, entry.name))
+            except FileNotFoundError:
+                continue
+        return existing
+
     def get_json_output_dirs(self, assert_exists=True):
         out = {}
         base = os.path.join(self.json_basedir, self.proj_id, self.exp_id)
+        existing = self._get_existing_json_subdirs(base) if assert_exists else set()
         for subdir in self.JSON_SUBDIRS:
-            loc = self._check_init_dir(os.path.join(base, subdir), assert_exists)
+            loc = os.path.join(base, subdir)
+            if assert_exists and not subdir in existing:
+                os.makedirs(loc, exist_ok=True)
             out[subdir] = loc
         return out
 
@@ -248,7 +278,7 @@ class ExperimentInfo(ConstrainedContainer):
         self.exp_name = ""
         self.exp_descr = ""
         self.public = False
-        self.exp_pi = getuser()
+        self.exp_pi = _get_default_user()
         self.pyaerocom_version = __version__
         self.update(**kwargs)
 
@@ -260,7 +290,6 @@ class EvalSetup(NestedContainer, ConstrainedContainer):
     setup files.
     """
 
-    IGNORE_JSON = ["_aux_funs"]
     ADD_GLOB = ["io_aux_file"]
     io_aux_file = AsciiFileLoc(
         default="",
@@ -269,7 +298,6 @@ class EvalSetup(NestedContainer, ConstrainedContainer):
         logger=logger,
         tooltip=".py file containing additional read methods for modeldata",
     )
-    _aux_funs = {}
 
     def __init__(self, proj_id: str = None, exp_id: str = None, **kwargs):
         if proj_id is None:
@@ -320,10 +348,29 @@ class EvalSetup(NestedContainer, ConstrainedContainer):
         return f"cfg_{self.proj_id}_{self.exp_id}.json"
 
     @property
-    def gridded_aux_funs(self):
-        if not bool(self._aux_funs) and os.path.exists(self.io_aux_file):
-            self._import_aux_funs()
-        return self._aux_funs
+    def gridded_aux_funs(self) -> dict:
+        """
+        dict: custom read methods defined in :attr:`io_aux_file`
+
+        The file is only imported once per session.
+        """
+        fp = self.io_aux_file
+        if not fp in _AUX_FUNS_CACHE:
+            if not os.path.exists(fp):
+                return {}
+            _AUX_FUNS_CACHE[fp] = ReadAuxHandler(fp).import_all()
+        return _AUX_FUNS_CACHE[fp]
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Hash of current configuration (cf. :func:`json_repr`)
+
+        Two setups with identical settings have the same hash. The hash is
+        computed on access, since the setup may be modified.
+        """
+        data = json.dumps(self.json_repr(), sort_keys=True, default=str)
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
 
     def get_obs_entry(self, obs_name):
         return self.obs_cfg.get_entry(obs_name).to_dict()
@@ -383,11 +430,6 @@ class EvalSetup(NestedContainer, ConstrainedContainer):
         settings = read_json(filepath)
         return EvalSetup(**settings)
 
-    def _import_aux_funs(self):
-
-        h = ReadAuxHandler(self.io_aux_file)
-        self._aux_funs.update(**h.import_all())
-
     def _check_time_config(self):
         periods = self.time_cfg.periods
         colstart = self.colocation_opts["start"]
@@ -1,7 +1,6 @@
 import logging
 from traceback import format_exc
 
-import numpy as np
 import xarray as xr
 
 from pyaerocom.aeroval._processing_base import HasColocator, ProcessingEngine
@@ -87,7 +86,7 @@ class SuperObsEngine(ProcessingEngine, HasColocator):
             coldata_resolutions.append(ts_type)
             vert_codes.append(vert_code)
 
-        if len(np.unique(vert_codes)) > 1 or vert_codes[0] != vert_code:
+        if len(set(vert_codes)) > 1 or vert_codes[0] != vert_code:
             raise ValueError(
                 "Cannot merge observations with different vertical types into "
                 "super observation..."
@@ -2,6 +2,7 @@ import logging
 import os
 import warnings
 from ast import literal_eval
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -31,6 +32,42 @@ from pyaerocom.time_resampler import TimeResampler
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _meta_from_filename(fname: str) -> dict:
+    """Parse meta information from colocated data file name (basename)
+
+    See :func:`ColocatedData.get_meta_from_filename` for details. Results are
+    cached, the returned dict must therefore not be modified.
+    """
+    spl = fname.split(".nc")[0].split("_")
+
+    if not spl[2].startswith("MOD"):
+        raise ValueError("File name does not follow convention")
+
+    modname = spl[2].split("MOD-")[1]
+    refname = ""
+    in_ref = False
+    for item in spl[3:-4]:
+        if in_ref:
+            refname += f"_{item}"
+        elif item.startswith("REF-"):
+            in_ref = True
+            refname = item.split("REF-")[1]
+        elif not in_ref:
+            modname += f"_{item}"
+
+    return dict(
+        model_var=spl[0],
+        obs_var=spl[1],
+        model_name=modname,
+        obs_name=refname,
+        start=spl[-4],
+        stop=spl[-3],
+        ts_type=spl[-2],
+        filter_name=spl[-1],
+    )
+
+
 class ColocatedData:
     """Class representing colocated and unified data from two sources
 
@@ -1095,36 +1132,7 @@ class ColocatedData:
         dict
             dicitonary with meta information
         """
-
-        spl = os.path.basename(file_path).split(".nc")[0].split("_")
-
-        if not spl[2].startswith("MOD"):
-            raise ValueError("File name does not follow convention")
-
-        modname = spl[2].split("MOD-")[1]
-        refname = ""
-        in_ref = False
-        for item in spl[3:-4]:
-            if in_ref:
-                refname += f"_{item}"
-            elif item.startswith("REF-"):
-                in_ref = True
-                refname = item.split("REF-")[1]
-            elif not in_ref:
-                modname += f"_{item}"
-
-        meta = dict(
-            model_var=spl[0],
-            obs_var=spl[1],
-            model_name=modname,
-            obs_name=refname,
-            start=spl[-4],
-            stop=spl[-3],
-            ts_type=spl[-2],
-            filter_name=spl[-1],
-        )
-
-        return meta
+        return dict(_meta_from_filename(os.path.basename(file_path)))
 
     def get_time_resampling_settings(self):
         """Returns a dictionary with relevant settings for temporal resampling
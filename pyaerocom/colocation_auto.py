@@ -1,12 +1,12 @@
 """
 Classes and methods to perform high-level colocation.
 """
-import glob
 import logging
 import os
 import sys
 import traceback
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 if sys.version_info >= (3, 10):  # pragma: no cover
@@ -14,6 +14,7 @@ if sys.version_info >= (3, 10):  # pragma: no cover
 else:  # pragma: no cover
     import importlib_metadata as metadata
 
+import numpy as np
 import pandas as pd
 
 from pyaerocom import const
@@ -38,6 +39,18 @@ from pyaerocom.io.helpers import get_all_supported_ids_ungridded
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _period_str_from_start_stop(start, stop) -> str:
+    """Period string (e.g. 2010 or 2010-2012) spanned by input start / stop"""
+    start, stop = start_stop(start, stop, stop_sub_sec=False)
+    y0, y1 = start.year, stop.year
+    assert y0 <= y1
+    if y0 == y1:
+        return str(y0)
+    else:
+        return f"{y0}-{y1}"
+
+
 class ColocationSetup(BrowseDict):
     """
     Setup class for high-level model / obs co-location.
@@ -200,6 +213,10 @@ class ColocationSetup(BrowseDict):
         fields are indicated with 9999 as year in the filename) and if this is
         active, only single year analysis are supported (i.e. provide int to
         :attr:`start` to specify the year and leave :attr:`stop` empty).
+    model_cast_float32 : bool
+        if True, model data that is stored in double precision is converted to
+        single precision (float32) after reading, which halves the memory
+        footprint of the model data. Defaults to False.
     gridded_reader_id : dict
         BETA: dictionary specifying which gridded reader is supposed to be used
         for model (and gridded obs) reading. Note: this is a workaround
@@ -298,11 +315,13 @@ class ColocationSetup(BrowseDict):
     #: (Overwritten from base class)
     CRASH_ON_INVALID = False
 
-    FORBIDDEN_KEYS = [
-        "var_outlier_ranges",  # deprecated since v0.12.0
-        "var_ref_outlier_ranges",  # deprecated since v0.12.0
-        "remove_outliers",  # deprecated since v0.12.0
-    ]
+    FORBIDDEN_KEYS = frozenset(
+        [
+            "var_outlier_ranges",  # deprecated since v0.12.0
+            "var_ref_outlier_ranges",  # deprecated since v0.12.0
+            "remove_outliers",  # deprecated since v0.12.0
+        ]
+    )
 
     ts_type = StrWithDefault("monthly")
     obs_vars = ListOfStrings()
@@ -367,6 +386,7 @@ class ColocationSetup(BrowseDict):
         self.model_ts_type_read = None
         self.model_read_aux = {}
         self.model_use_climatology = False
+        self.model_cast_float32 = False
 
         self.gridded_reader_id = {"model": "ReadGridded", "obs": "ReadGridded"}
 
@@ -419,8 +439,10 @@ class ColocationSetup(BrowseDict):
         if isinstance(basedir_coldata, Path):
             basedir_coldata = str(basedir_coldata)
         if isinstance(basedir_coldata, str):
-            if not os.path.exists(basedir_coldata):
+            try:
                 os.mkdir(basedir_coldata)
+            except FileExistsError:
+                pass
             return basedir_coldata
         raise ValueError(f"Invalid input for basedir_coldata: {basedir_coldata}")
 
@@ -484,13 +506,10 @@ class ColocationSetup(BrowseDict):
         super().__setitem__(key, val)
 
     def _period_from_start_stop(self) -> str:
-        start, stop = start_stop(self.start, self.stop, stop_sub_sec=False)
-        y0, y1 = start.year, stop.year
-        assert y0 <= y1
-        if y0 == y1:
-            return str(y0)
-        else:
-            return f"{y0}-{y1}"
+        try:
+            return _period_str_from_start_stop(self.start, self.stop)
+        except TypeError:  # unhashable input, cannot be cached
+            return _period_str_from_start_stop.__wrapped__(self.start, self.stop)
 
 
 class Colocator(ColocationSetup):
@@ -623,9 +642,12 @@ class Colocator(ColocationSetup):
         """
         self._check_basedir_coldata()
         loc = os.path.join(self.basedir_coldata, self.get_model_name())
-        if not os.path.exists(loc):
-            logger.info(f"Creating dir {loc}")
+        try:
             os.mkdir(loc)
+        except FileExistsError:
+            pass
+        else:
+            logger.info(f"Creating dir {loc}")
         return loc
 
     @property
@@ -697,9 +719,31 @@ class Colocator(ColocationSetup):
                 return mdata
         self._check_add_model_read_aux(model_var)
         mdata = self._read_gridded(var_name=model_var, is_model=True)
+        if self.model_cast_float32 and mdata.cube.dtype == np.float64:
+            mdata.cube.data = mdata.cube.core_data().astype(np.float32)
         self._loaded_model_data[model_var] = mdata
         return mdata
 
+    def clear_model_data_cache(self, var=None):
+        """
+        Remove model data that was loaded via :func:`get_model_data`
+
+        Parameters
+        ----------
+        var : str, optional
+            variable for which loaded model data is removed. This may be the
+            model variable name or the name it is mapped from / to via
+            :attr:`model_use_vars` or :attr:`model_rename_vars`. If None,
+            all loaded model data is removed.
+        """
+        if var is None:
+            self._loaded_model_data = {}
+            return
+        model_vars = {var, self.model_use_vars.get(var, var)}
+        model_vars.update(mvar for mvar, name in self.model_rename_vars.items() if name == var)
+        for model_var in model_vars:
+            self._loaded_model_data.pop(model_var, None)
+
     def get_obs_data(self, obs_var):
         if self.obs_is_ungridded:
             return self._read_ungridded(obs_var)
@@ -831,8 +875,12 @@ class Colocator(ColocationSetup):
             list of NetCDF file paths found
 
         """
-        mask = f"{self.output_dir}/*.nc"
-        return glob.glob(mask)
+        files = []
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".nc") and not entry.name.startswith("."):
+                    files.append(entry.path)
+        return files
 
     def get_available_coldata_files(self, var_list: list = None) -> list:
         self._check_set_start_stop()
@@ -845,8 +893,10 @@ class Colocator(ColocationSetup):
 
         mname = self.get_model_name()
         oname = self.get_obs_name()
-        model_vars = self.model_vars
-        obs_vars = self.obs_vars
+        model_vars = set(self.model_vars)
+        obs_vars = set(self.obs_vars)
+        if var_list is not None:
+            var_list = set(var_list)
         start, stop = self.get_start_str(), self.get_stop_str()
         valid = []
         all_files = self.get_nc_files_in_coldatadir()
@@ -859,15 +909,11 @@ class Colocator(ColocationSetup):
                 meta, model_name=mname, obs_name=oname, start=start, stop=stop
             )
             if candidate and meta["model_var"] in model_vars and meta["obs_var"] in obs_vars:
-                if var_list is None:
-                    ok = True
-                else:
-                    ok = False
-                    for var in var_list:
-                        if meta["model_var"] == var or meta["obs_var"] == var:
-                            ok = True
-                            break
-                if ok:
+                if (
+                    var_list is None
+                    or meta["model_var"] in var_list
+                    or meta["obs_var"] in var_list
+                ):
                     valid.append(file)
 
         return valid
@@ -1078,7 +1124,9 @@ class Colocator(ColocationSetup):
             self.obs_vars = avail
 
     def _print_processing_status(self):
-
+        if not logger.isEnabledFor(logging.INFO):
+            # skip creation of status table, which would be discarded
+            return
         mname = self.get_model_name()
         oname = self.get_obs_name()
         logger.info(f"Colocation processing status for {mname} vs. {oname}")
@@ -2,6 +2,7 @@ import getpass
 import logging
 import os
 from configparser import ConfigParser
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -21,6 +22,41 @@ from pyaerocom.varcollection import VarCollection
 
 logger = logging.getLogger(__name__)
 
+#: database environments found by :func:`Config.infer_basedir_and_config`
+#: (keys are tuples of searched base directories, values are tuples of
+#: database directory and config file)
+_INFERRED_ENVIRONMENTS = {}
+
+
+#: parsed configuration files (keys are file paths, values are tuples of
+#: (modification time, file size) and the corresponding ConfigParser)
+_CONFIG_INI_CACHE = {}
+
+
+def _read_config_ini(config_file: str) -> ConfigParser:
+    """Parse ini file, the result is re-used as long as the file is unchanged
+
+    Note
+    ----
+    The returned parser is shared and must not be modified.
+    """
+    config_file = os.path.abspath(config_file)
+    st = os.stat(config_file)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_INI_CACHE.get(config_file)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    cr = ConfigParser()
+    cr.read(config_file)
+    _CONFIG_INI_CACHE[config_file] = (key, cr)
+    return cr
+
+
+@lru_cache(maxsize=1)
+def _get_user() -> str:
+    """User ID (looked up only once, may require access to password database)"""
+    return getpass.getuser()
+
 
 class Config:
     """Class containing relevant paths for read and write routines
@@ -219,8 +255,8 @@ class Config:
         self.last_config_file = None
         self._ebas_flag_info = None
 
-        #: Settings for reading and writing of gridded data
-        self.GRID_IO = GridIO()
+        # settings for reading and writing of gridded data, see GRID_IO
+        self._grid_io = None
 
         if config_file is not None:
             if not os.path.exists(config_file):
@@ -291,13 +327,20 @@ class Config:
 
     def infer_basedir_and_config(self):
         """Boolean specifying whether the lustre database can be accessed"""
+        basedirs = tuple(self._basedirs_search_db())
+        # access checks can be slow (e.g. on network file systems), so the
+        # environment is only searched once per session
+        if basedirs in _INFERRED_ENVIRONMENTS:
+            return _INFERRED_ENVIRONMENTS[basedirs]
         for sub_envdir, cfg_id in self._DB_SEARCH_SUBDIRS.items():
-            for sdir in self._basedirs_search_db():
+            for sdir in basedirs:
                 basedir = os.path.join(sdir, sub_envdir)
                 if self._check_access(basedir):
                     _chk_dir = os.path.join(basedir, self._check_subdirs_cfg[cfg_id])
                     if self._check_access(_chk_dir):
-                        return (basedir, self._config_files[cfg_id])
+                        result = (basedir, self._config_files[cfg_id])
+                        _INFERRED_ENVIRONMENTS[basedirs] = result
+                        return result
         raise FileNotFoundError("Could not establish access to any registered database")
 
     @property
@@ -411,7 +454,7 @@ class Config:
     @property
     def user(self):
         """User ID"""
-        return getpass.getuser()
+        return _get_user()
 
     @property
     def cache_basedir(self):
@@ -476,6 +519,17 @@ class Config:
             self._var_param = VarCollection(self._var_info_file)
         return self._var_param
 
+    @property
+    def GRID_IO(self):
+        """Settings for reading and writing of gridded data (:class:`GridIO`)"""
+        if self._grid_io is None:  # has not been accessed before
+            self._grid_io = GridIO()
+        return self._grid_io
+
+    @GRID_IO.setter
+    def GRID_IO(self, val):
+        self._grid_io = val
+
     @property
     def COORDINFO(self):
         """Instance of :class:`VarCollection` containing coordinate info"""
@@ -512,9 +566,11 @@ class Config:
     @property
     def OBS_IDS_UNGRIDDED(self):
         """List of all data IDs of supported ungridded observations"""
-        ids = list(self.OBSLOCS_UNGRIDDED)
-        ids.extend(self.OBS_UNGRIDDED_POST)
-        return ids
+        return [*self.OBSLOCS_UNGRIDDED, *self.OBS_UNGRIDDED_POST]
+
+    def _is_ungridded_obs_id(self, obs_id):
+        """Check if input ID is registered, without building :attr:`OBS_IDS_UNGRIDDED`"""
+        return obs_id in self.OBSLOCS_UNGRIDDED or obs_id in self.OBS_UNGRIDDED_POST
 
     @property
     def ERA5_SURFTEMP_FILE(self):
@@ -563,7 +619,7 @@ class Config:
         ValueError
             if the data directory does not exist
         """
-        if obs_id in self.OBS_IDS_UNGRIDDED:
+        if self._is_ungridded_obs_id(obs_id):
             raise DataIdError(
                 f"Network with ID {obs_id} is already registered at "
                 f"{self.OBSLOCS_UNGRIDDED[obs_id]}"
@@ -645,7 +701,7 @@ class Config:
         None.
 
         """
-        if obs_id in self.OBS_IDS_UNGRIDDED:
+        if self._is_ungridded_obs_id(obs_id):
             raise ValueError(f"Network with ID {obs_id} is already registered...")
         elif obs_aux_units is None:
             obs_aux_units = {}
@@ -760,8 +816,7 @@ class Config:
         if init_data_search_dirs:
             self._search_dirs = []
 
-        cr = ConfigParser()
-        cr.read(config_file)
+        cr = _read_config_ini(config_file)
         # init base directories for Model data
         if cr.has_section("modelfolders"):
             self._add_searchdirs(cr, basedir)
@@ -781,7 +836,6 @@ class Config:
                     path = path.replace("${BASEDIR}", basedir)
                 self.SUPPLDIRS[name] = path
 
-        cr.clear()
         self.GRID_IO.load_aerocom_default()
         self.last_config_file = config_file
 
@@ -853,22 +907,21 @@ class Config:
         candidates = {}
         dirconfirmed = None
         repl = "${BASEDIR}"
-        if cr.has_section("obsfolders"):
-            for obsname, path in cr["obsfolders"].items():
-                if obsname.lower() == "basedir":
-                    continue
-                name_str = f"{obsname.upper()}_NAME"
-                if name_str in names_cfg:
-                    ID = self.__dict__[name_str]
-                else:
-                    ID = self._add_obsname(obsname)
-                candidates[ID] = path
-                # candidate for checking access
-                if dirconfirmed is None and repl in path:
-                    for chk_dir in chk_dirs:
-                        chk = Path(path.replace(repl, chk_dir))
-                        if self._check_access(chk):
-                            dirconfirmed = str(chk_dir)
+        for obsname, path in cfg.items():
+            if obsname.lower() == "basedir":
+                continue
+            name_str = f"{obsname.upper()}_NAME"
+            if name_str in names_cfg:
+                ID = names_cfg[name_str]
+            else:
+                ID = self._add_obsname(obsname)
+            candidates[ID] = path
+            # candidate for checking access
+            if dirconfirmed is None and repl in path:
+                for chk_dir in chk_dirs:
+                    chk = Path(path.replace(repl, chk_dir))
+                    if self._check_access(chk):
+                        dirconfirmed = str(chk_dir)
         homedir = os.path.expanduser("~")
         for name, loc in candidates.items():
             if repl in loc:
@@ -897,7 +950,7 @@ class Config:
             if "${HOME}" in _dir:
                 _dir = _dir.replace("${HOME}", os.path.expanduser("~"))
             if "${USER}" in _dir:
-                _dir = _dir.replace("${USER}", getpass.getuser())
+                _dir = _dir.replace("${USER}", _get_user())
 
             self._local_tmp_dir = _dir
 
@@ -907,12 +960,12 @@ class Config:
         return name_str
 
     def _add_obsnames_config(self, cr):
-        names_cfg = []
+        names_cfg = {}
         if cr.has_section("obsnames"):
             for obsname, ID in cr["obsnames"].items():
                 name_str = f"{obsname.upper()}_NAME"
                 self[name_str] = ID
-                names_cfg.append(name_str)
+                names_cfg[name_str] = ID
         return names_cfg
 
     def short_str(self):
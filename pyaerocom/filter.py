@@ -35,6 +35,8 @@ class Filter:
     def __init__(self, name=None, region=None, altitude_filter=None, land_ocn=None, **kwargs):
         # default name (i.e. corresponds to no filtering)
         self._name = None
+        # name split into its specifications, updated whenever name is set
+        self._spl = None
 
         # this will be used to store instance of Region associated with filter
         self._region = None
@@ -55,6 +57,7 @@ class Filter:
     @name.setter
     def name(self, val):
         self._name = self._check_name_valid(val)
+        self._spl = self._name.split(self._DELIM)
 
     def _check_name_valid(self, val):
         if not isinstance(val, list):
@@ -70,8 +73,9 @@ class Filter:
         reg = None
         alt_filter = None
         landsea = None
+        valid_regions = set(self.valid_regions)
         for entry in spl:
-            if entry in self.valid_regions:
+            if entry in valid_regions:
                 if entry in self.LAND_OCN_FILTERS:
                     if landsea is not None:
                         raise ValueError("Filter name must only contain one landsea specification")
@@ -81,7 +85,7 @@ class Filter:
                         raise ValueError("Only one region may be specified")
                     reg = entry
 
-            elif entry in self.valid_alt_filter_codes:
+            elif entry in self.ALTITUDE_FILTERS:
                 if alt_filter is not None:
                     raise ValueError("Only one altitude filter can be specified")
                 alt_filter = entry
@@ -99,7 +103,7 @@ class Filter:
 
     @property
     def spl(self):
-        return self._name.split(self._DELIM)
+        return self._spl
 
     @property
     def region_name(self):
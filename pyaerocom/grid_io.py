@@ -60,6 +60,14 @@ class GridIO:
         when necessary (e.g. when extracting surface time series from 4D
         gridded data object that does not contain sufficient information about
         vertical dimension)
+    NC_CHUNK_CACHE_SIZE : int, optional
+        size in bytes of the HDF5 chunk cache used for each variable when
+        reading NetCDF4 files (e.g. 64 * 1024**2). Note that this changes the
+        chunk cache of the netCDF library for the whole process. Defaults to
+        None, in which case the netCDF library settings are not modified.
+    NC_CHUNK_CACHE_NELEMS : int
+        number of chunk slots in the HDF5 chunk cache (should be a prime
+        number). Only applied if :attr:`NC_CHUNK_CACHE_SIZE` is set.
 
     """
 
@@ -114,6 +122,9 @@ class GridIO:
 
         self.INFER_SURFACE_LEVEL = True
 
+        self.NC_CHUNK_CACHE_SIZE = None
+        self.NC_CHUNK_CACHE_NELEMS = 40009
+
         self.load_default()
 
     def load_aerocom_default(self):
@@ -167,4 +178,4 @@ class GridIO:
 
     def __str__(self):
         head = f"Pyaerocom {type(self).__name__}"
-        return "\n{}\n{}\n{}".format(head, len(head) * "-", dict_to_str(self.to_dict()))
+        return f"\n{head}\n{len(head) * '-'}\n{dict_to_str(self.to_dict())}"
@@ -5,6 +5,7 @@ import glob
 import logging
 import os
 import pickle
+import tempfile
 
 from pyaerocom import const
 from pyaerocom.exceptions import CacheReadError, CacheWriteError
@@ -338,7 +339,15 @@ class CacheHandlerUngridded:
         logger.info(f"Writing cache file: {fp}")
         success = True
         # OutHandle = gzip.open(c__cache_file, 'wb') # takes too much time
-        out_handle = open(fp, "wb")
+        # write into temporary file in the same directory, which is moved to
+        # the cache file path afterwards, so that concurrent readers never
+        # load a partially written cache file
+        out_handle = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(fp),
+            prefix=f".{os.path.basename(fp)}.",
+            suffix=".tmp",
+            delete=False,
+        )
 
         try:
             # write cache header
@@ -351,8 +360,15 @@ class CacheHandlerUngridded:
             success = False
         finally:
             out_handle.close()
-            if not success:
-                os.remove(fp)
+            if success:
+                os.replace(out_handle.name, fp)
+                # NamedTemporaryFile creates files with mode 0600, apply the
+                # permissions a regular cache file would get instead
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(fp, 0o666 & ~umask)
+            else:
+                os.remove(out_handle.name)
         logger.info(f"Wrote: {fp}")
         return fp
 
@@ -41,6 +41,30 @@ from pyaerocom.tstype import TsType
 
 logger = logging.getLogger(__name__)
 
+#: chunk cache settings that were last applied via netCDF4.set_chunk_cache
+_NC_CHUNK_CACHE_APPLIED = None
+
+
+def _check_set_netcdf_chunk_cache():
+    """Apply chunk cache settings from :attr:`const.GRID_IO` to netCDF library
+
+    Nothing is done unless :attr:`GridIO.NC_CHUNK_CACHE_SIZE` is set. The
+    settings apply to all files that are opened after the call, thus they
+    only need to be updated if they changed since the last call.
+    """
+    global _NC_CHUNK_CACHE_APPLIED
+    if const.GRID_IO.NC_CHUNK_CACHE_SIZE is None:
+        return
+    settings = (const.GRID_IO.NC_CHUNK_CACHE_SIZE, const.GRID_IO.NC_CHUNK_CACHE_NELEMS)
+    if settings == _NC_CHUNK_CACHE_APPLIED:
+        return
+    try:
+        import netCDF4
+    except ImportError:  # pragma: no cover
+        return
+    netCDF4.set_chunk_cache(*settings)
+    _NC_CHUNK_CACHE_APPLIED = settings
+
 
 def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_checks=True):
     """Load multiple NetCDF files into CubeList
@@ -122,7 +146,13 @@ def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_chec
         file = str(file)  # iris load does not like PosixPath
     if perform_fmt_checks is None:
         perform_fmt_checks = const.GRID_IO.PERFORM_FMT_CHECKS
-    cube_list = iris.load(file)
+    _check_set_netcdf_chunk_cache()
+    if var_name is None:
+        cube_list = iris.load(file)
+    else:
+        # only create cube(s) for the requested variable (files may contain
+        # many variables, which would otherwise all be converted to cubes)
+        cube_list = iris.load(file, iris.NameConstraint(var_name=var_name))
     cube = None
     if var_name is None:
         if not len(cube_list) == 1:
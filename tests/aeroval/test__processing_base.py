@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from pyaerocom import Colocator, GriddedData, UngriddedData
@@ -30,6 +32,11 @@ def test_HasConfig_setup(config: HasConfig):
     assert isinstance(config.exp_output, ExperimentOutput)
 
 
+def test_HasConfig_invalid_cfg():
+    with pytest.raises(ValueError):
+        HasConfig(dict(proj_id="bla", exp_id="blub"))
+
+
 def test_HasConfig_raise_exceptions(config: HasConfig):
     assert config.raise_exceptions == False
 
@@ -38,6 +45,15 @@ def test_HasConfig_reanalyse_existing(config: HasConfig):
     assert config.reanalyse_existing == True
 
 
+def test_HasConfig_colocation_opts_changed():
+    setup = EvalSetup("bla", "blub")
+    config = HasConfig(setup)
+    setup.colocation_opts.raise_exceptions = True
+    setup.colocation_opts.reanalyse_existing = False
+    assert config.raise_exceptions == True
+    assert config.reanalyse_existing == False
+
+
 @pytest.fixture(scope="module")
 def collocator(setup: EvalSetup) -> HasColocator:
     """HasColocator instance"""
@@ -55,6 +71,38 @@ def test_HasColocator_get_colocator(collocator: HasColocator, obs_name: str | No
     assert isinstance(col, Colocator)
 
 
+@pytest.mark.parametrize("obs_name,diurnal_only", [("obs1", False), ("obs2", True)])
+def test_HasColocator__get_diurnal_only(
+    collocator: HasColocator, obs_name: str, diurnal_only: bool
+):
+    assert collocator._get_diurnal_only(obs_name) == diurnal_only
+
+
+def test_HasColocator__get_coldata_dir(collocator: HasColocator):
+    coldata_dir = collocator._get_coldata_dir()
+    assert coldata_dir == collocator.cfg.path_manager.get_coldata_dir()
+    assert collocator._get_coldata_dir() is coldata_dir
+
+
+def test_HasColocator__get_coldata_dir_removed(tmp_path: Path):
+    setup = EvalSetup("bla", "blub", coldata_basedir=str(tmp_path))
+    collocator = HasColocator(setup)
+    coldata_dir = Path(collocator._get_coldata_dir())
+    assert coldata_dir.is_dir()
+    coldata_dir.rmdir()
+    assert Path(collocator._get_coldata_dir()) == coldata_dir
+    assert coldata_dir.is_dir()
+
+
+def test_HasColocator_get_colocator_obs_cfg_changed():
+    obs_cfg = dict(obs1=dict(obs_id="obs1", obs_vars=["od550aer"], obs_vert_type="Column"))
+    setup = EvalSetup("bla", "blub", obs_cfg=obs_cfg)
+    collocator = HasColocator(setup)
+    assert collocator.get_colocator(obs_name="obs1").obs_vert_type == "Column"
+    setup.obs_cfg["obs1"]["obs_vert_type"] = "Surface"
+    assert collocator.get_colocator(obs_name="obs1").obs_vert_type == "Surface"
+
+
 def test_HasColocator_get_colocator_error(collocator: HasColocator):
     with pytest.raises(EntryNotAvailable) as e:
         collocator.get_colocator(model_name="mod2")
@@ -74,6 +122,13 @@ def test_DataImporter_read_model_data(importer: DataImporter):
     assert isinstance(data, GriddedData)
 
 
+@pytest.mark.parametrize("cfg", ["cfgexp1"])
+def test_DataImporter_read_model_data_batch(importer: DataImporter):
+    data = importer.read_model_data_batch("TM5-AP3-CTRL", ["od550aer"])
+    assert list(data) == ["od550aer"]
+    assert isinstance(data["od550aer"], GriddedData)
+
+
 @pytest.mark.parametrize("cfg", ["cfgexp1"])
 def test_DataImporter_read_ungridded_obsdata(importer: DataImporter):
     data = importer.read_ungridded_obsdata("AERONET-Sun", "od550aer")
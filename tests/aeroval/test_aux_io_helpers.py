@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 from textwrap import dedent
 from typing import List
@@ -27,6 +28,25 @@ def test_ReadAuxHandler(tmp_path: Path):
     assert funcs[0] is success
 
 
+def test_ReadAuxHandler_import_module_sys_path(tmp_path: Path):
+    moddir = str(tmp_path)
+    for name in ("dummy_sys_path1", "dummy_sys_path2"):
+        (tmp_path / f"{name}.py").write_text("FUNS = []\n")
+
+    ReadAuxHandler(str(tmp_path / "dummy_sys_path1.py")).import_module()
+    assert sys.path.count(moddir) == 1
+
+    # directory is added again if it was removed from sys.path in the meantime
+    sys.path.remove(moddir)
+    try:
+        mod = ReadAuxHandler(str(tmp_path / "dummy_sys_path2.py")).import_module()
+        assert mod.FUNS == []
+        assert sys.path.count(moddir) == 1
+    finally:
+        while moddir in sys.path:
+            sys.path.remove(moddir)
+
+
 def test_ReadAuxHandler_empty(tmp_path: Path):
     path = tmp_path / "empty.py"
     assert not path.exists()
@@ -1,4 +1,8 @@
+import pytest
+
 from pyaerocom.aeroval.collections import ObsCollection
+from pyaerocom.aeroval.obsentry import ObsEntry
+from pyaerocom.exceptions import EvalEntryNameError
 
 
 def test_obscollection():
@@ -13,3 +17,43 @@ def test_obscollection():
     )
 
     assert "AN-EEA-MP" in oc
+
+
+def test_obscollection_setitem_entry():
+    oc = ObsCollection()
+    entry = ObsEntry(obs_id="bla", obs_vars="od550aer", obs_vert_type="Column")
+    oc["obs1"] = entry
+    assert oc["obs1"] is entry
+    oc["obs2"] = dict(obs_id="bla", obs_vars="od550aer", obs_vert_type="Column")
+    assert isinstance(oc["obs2"], ObsEntry)
+
+
+@pytest.mark.parametrize("key,web_iface_name", [("obs_1", None), ("obs1", "obs_1")])
+def test_obscollection_setitem_invalid_name(key, web_iface_name):
+    oc = ObsCollection()
+    entry = dict(obs_id="bla", obs_vars="od550aer", obs_vert_type="Column")
+    if web_iface_name is not None:
+        entry["web_interface_name"] = web_iface_name
+    with pytest.raises(EvalEntryNameError):
+        oc[key] = entry
+
+
+def test_obscollection_keylist():
+    oc = ObsCollection()
+    with pytest.raises(KeyError):
+        oc.keylist()
+    for name in ("obs1", "obs2", "bla"):
+        oc[name] = dict(obs_id="bla", obs_vars="od550aer", obs_vert_type="Column")
+    assert oc.keylist() == ["obs1", "obs2", "bla"]
+    assert oc.keylist("obs*") == ["obs1", "obs2"]
+
+
+def test_obscollection_web_iface_names():
+    oc = ObsCollection()
+    oc["obs1"] = dict(obs_id="bla", obs_vars="od550aer", obs_vert_type="Column")
+    oc["obs2"] = dict(
+        obs_id="bla", obs_vars="od550aer", obs_vert_type="Column", web_interface_name="OBS"
+    )
+    assert oc.get_web_iface_name("obs1") == "obs1"
+    assert oc.get_web_iface_name("obs2") == "OBS"
+    assert oc.web_iface_names == ["obs1", "OBS"]
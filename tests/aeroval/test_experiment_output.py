@@ -151,10 +151,24 @@ def test_ExperimentOutput_results_available_False(dummy_expout: ExperimentOutput
     assert not dummy_expout.results_available
 
 
+def test_ExperimentOutput_results_available(dummy_expout: ExperimentOutput):
+    mapdir = Path(dummy_expout.out_dirs_json["map"])
+    assert not dummy_expout.results_available
+    (mapdir / "bla.json").write_text("{}")
+    assert dummy_expout.results_available
+
+
+def test_ExperimentOutput_out_dirs_json(dummy_expout: ExperimentOutput):
+    out_dirs = dummy_expout.out_dirs_json
+    assert out_dirs == dummy_expout.cfg.path_manager.get_json_output_dirs()
+    dummy_expout.delete_experiment_data(also_coldata=False)
+    assert all(Path(path).is_dir() for path in dummy_expout.out_dirs_json.values())
+
+
 def test_ExperimentOutput_update_menu_EMPTY(dummy_expout: ExperimentOutput):
-    dummy_expout.update_menu()
+    menu = dummy_expout.update_menu()
     assert Path(dummy_expout.menu_file).exists()
-    assert read_json(dummy_expout.menu_file) == {}
+    assert read_json(dummy_expout.menu_file) == menu == {}
 
 
 def test_ExperimentOutput_update_interface_EMPTY(dummy_expout: ExperimentOutput):
@@ -165,6 +179,24 @@ def test_ExperimentOutput_update_heatmap_json_EMPTY(dummy_expout: ExperimentOutp
     dummy_expout._sync_heatmaps_with_menu_and_regions()
 
 
+def test_ExperimentOutput__sync_heatmaps_with_menu_and_regions(dummy_expout: ExperimentOutput):
+    write_json({"EUROPE": {}}, dummy_expout.regions_file)
+    entry = {"EUROPE": {"2010": 42}}
+    data = {
+        "AOD": {
+            "AERONET": {
+                "Column": {"MOD1": {"od550aer": entry}, "MOD2": {"od550aer": entry}},
+            },
+            "MODIS": {"Column": {"MOD1": {"od550aer": entry}}},
+        }
+    }
+    fp = Path(dummy_expout.out_dirs_json["hm"]) / "glob_stats_monthly.json"
+    write_json(data, fp)
+    menu = {"AOD": {"obs": {"AERONET": {"Column": {"MOD1": {"model_var": "od550aer"}}}}}}
+    dummy_expout._sync_heatmaps_with_menu_and_regions(menu)
+    assert read_json(fp) == {"AOD": {"AERONET": {"Column": {"MOD1": {"od550aer": entry}}}}}
+
+
 def test_ExperimentOutput__info_from_map_file():
     output = ExperimentOutput._info_from_map_file(
         "EBAS-2010-ac550aer_Surface_ECHAM-HAM-ac550dryaer_2010.json"
@@ -189,6 +221,19 @@ def test_ExperimentOutput__info_from_map_file_error(filename: str):
     )
 
 
+def test_ExperimentOutput__get_json_output_files(dummy_expout: ExperimentOutput):
+    mapdir = Path(dummy_expout.out_dirs_json["map"])
+    assert dummy_expout._get_json_output_files("map") == []
+    (mapdir / "AERONET-od550aer_Column_TM5-od550aer_2010.json").write_text("{}")
+    (mapdir / ".hidden.json").write_text("{}")
+    (mapdir / "bla.txt").write_text("")
+    files = dummy_expout._get_json_output_files("map")
+    assert files == [str(mapdir / "AERONET-od550aer_Column_TM5-od550aer_2010.json")]
+    # files written shortly after a listing are found as well
+    (mapdir / "AERONET-od550aer_Column_TM5-od550aer_2011.json").write_text("{}")
+    assert len(dummy_expout._get_json_output_files("map")) == 2
+
+
 def test_ExperimentOutput__results_summary_EMPTY(dummy_expout: ExperimentOutput):
     assert dummy_expout._results_summary() == dict(obs=[], ovar=[], vc=[], mod=[], mvar=[], per=[])
 
@@ -203,6 +248,27 @@ def test_ExperimentOutput__clean_modelmap_files(dummy_expout: ExperimentOutput):
     dummy_expout._clean_modelmap_files()
 
 
+@pytest.mark.parametrize(
+    "add_model_maps,invalid,removed",
+    [
+        (False, [], ["od550aer_MOD1.json", "od550aer_MOD1.geojson", "od550aer_MOD2.json"]),
+        (True, [], []),
+        (True, ["MOD1"], ["od550aer_MOD1.json", "od550aer_MOD1.geojson"]),
+    ],
+)
+def test_ExperimentOutput__clean_modelmap_files_REMOVE(
+    dummy_expout: ExperimentOutput, add_model_maps: bool, invalid: list, removed: list
+):
+    contourdir = Path(dummy_expout.out_dirs_json["contour"])
+    for fname in ("od550aer_MOD1.json", "od550aer_MOD1.geojson", "od550aer_MOD2.json"):
+        (contourdir / fname).write_text("{}")
+    dummy_expout.cfg.webdisp_opts.add_model_maps = add_model_maps
+    dummy_expout._invalid["models"].extend(invalid)
+    result = dummy_expout._clean_modelmap_files()
+    assert sorted(result) == sorted(str(contourdir / fname) for fname in removed)
+    assert not any(Path(fp).exists() for fp in result)
+
+
 @pytest.mark.parametrize("also_coldata", [True, False])
 def test_ExperimentOutput_delete_experiment_data(tmp_path: Path, also_coldata: bool):
     json_path = tmp_path / "json"
@@ -245,6 +311,52 @@ def test_ExperimentOutput__get_cmap_info(dummy_expout: ExperimentOutput, var, va
     assert dummy_expout._get_cmap_info(var) == val
 
 
+@pytest.mark.parametrize(
+    "var,val",
+    [
+        ("od550aer", ("AOD", "2D", "Optical properties")),
+        ("concpm10", ("PM10 (custom)", "2D", "Custom")),
+        ("blablub", ("blablub", "UNDEFINED", "UNDEFINED")),
+    ],
+)
+def test_ExperimentOutput__get_var_name_and_type(dummy_expout: ExperimentOutput, var, val):
+    dummy_expout.cfg.var_web_info["concpm10"] = ["PM10 (custom)", "2D", "Custom"]
+    assert dummy_expout._get_var_name_and_type(var) == val
+
+
+def test_ExperimentOutput__get_obs_entries_web_iface(tmp_path: Path):
+    obs_cfg = dict(
+        obs1=dict(obs_id="obs1", obs_vars=["od550aer"], obs_vert_type="Column"),
+        obs2=dict(
+            obs_id="obs2",
+            obs_vars=["od550aer"],
+            obs_vert_type="Column",
+            web_interface_name="obs1",
+        ),
+        obs3=dict(obs_id="obs3", obs_vars=["od550aer"], obs_vert_type="Column"),
+    )
+    setup = EvalSetup("proj", "exp", json_basedir=str(tmp_path), obs_cfg=obs_cfg)
+    index = ExperimentOutput(setup)._get_obs_entries_web_iface()
+    assert sorted(index) == ["obs1", "obs3"]
+    assert [entry["obs_id"] for entry in index["obs1"]] == ["obs1", "obs2"]
+
+
+def test_ExperimentOutput__get_valid_obs_vars(tmp_path: Path):
+    obs_cfg = dict(obs1=dict(obs_id="obs1", obs_vars=["od550aer"], obs_vert_type="Column"))
+    model_cfg = dict(
+        mod1=dict(model_id="mod1", model_add_vars=dict(od550aer=["od550csaer"])),
+        mod2=dict(model_id="mod2", model_add_vars=dict(abs550aer=["abs550bc"])),
+    )
+    setup = EvalSetup(
+        "proj", "exp", json_basedir=str(tmp_path), obs_cfg=obs_cfg, model_cfg=model_cfg
+    )
+    expout = ExperimentOutput(setup)
+    valid = expout._get_valid_obs_vars("obs1")
+    assert valid == {"od550aer", "od550csaer"}
+    assert expout._get_valid_obs_vars("obs1") == valid
+    assert setup.obs_cfg["obs1"]["obs_vars"] == ["od550aer"]
+
+
 ### BELOW ARE TESTS ON ACTUAL OUTPUT THAT DEPEND ON EVALUATION RUNS
 
 
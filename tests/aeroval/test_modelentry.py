@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from pyaerocom.aeroval.modelentry import ModelEntry
+
+
+def test_ModelEntry___init__():
+    entry = ModelEntry("model")
+    assert list(entry.keys()) == [
+        "model_id",
+        "model_ts_type_read",
+        "model_use_vars",
+        "model_add_vars",
+        "model_rename_vars",
+        "model_read_aux",
+    ]
+    assert entry.model_id == "model"
+    assert entry.model_add_vars == {}
+    assert entry["model_ts_type_read"] == ""
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(model_use_vars="od550aer"),
+        dict(model_add_vars=dict(od550aer="od550csaer")),
+        dict(model_add_vars={42: ["od550csaer"]}),
+    ],
+)
+def test_ModelEntry___init___error(kwargs: dict):
+    with pytest.raises(ValueError):
+        ModelEntry("model", **kwargs)
+
+
+def test_ModelEntry_get_vars_to_process():
+    entry = ModelEntry(
+        "model",
+        model_use_vars=dict(od550aer="od550csaer"),
+        model_add_vars=dict(od550aer=["od550so4"]),
+    )
+    obs_vars, mod_vars = entry.get_vars_to_process(["od550aer", "ang4487aer"])
+    assert obs_vars == ["od550aer", "ang4487aer", "od550aer"]
+    assert mod_vars == ["od550csaer", "ang4487aer", "od550so4"]
@@ -33,6 +33,15 @@ def test_evalsetup_kwargs():
     assert setup.exp_id == setup.exp_info.exp_id == "experiment"
 
 
+def test_evalsetup_content_hash():
+    setup = EvalSetup("project", "experiment")
+    assert setup.content_hash == EvalSetup("project", "experiment").content_hash
+    assert setup.content_hash != EvalSetup("project", "experiment2").content_hash
+    old = setup.content_hash
+    setup.colocation_opts.raise_exceptions = not setup.colocation_opts.raise_exceptions
+    assert setup.content_hash != old
+
+
 def test_evalsetup_missing_arguments():
     with pytest.raises((KeyError, ValueError)):
         EvalSetup()
@@ -1,6 +1,8 @@
+from pathlib import Path
+
 import pytest
 
-from pyaerocom.aeroval.setupclasses import EvalSetup
+from pyaerocom.aeroval.setupclasses import EvalSetup, OutputPaths
 from pyaerocom.exceptions import EvalEntryNameError
 from tests.fixtures.aeroval.cfg_test_exp1 import CFG
 
@@ -42,3 +44,29 @@ def test_EvalSetup___init__INVALID_ENTRY_NAMES(eval_config: dict, update: dict,
     with pytest.raises(EvalEntryNameError) as e:
         EvalSetup(**eval_config)
     assert error in str(e.value)
+
+
+def test_EvalSetup_gridded_aux_funs(tmp_path: Path):
+    setup = EvalSetup("proj", "exp")
+    assert setup.gridded_aux_funs == {}
+
+    aux_file = tmp_path / "aux_funs_evalsetup_test.py"
+    aux_file.write_text("def fun(*args):\n    return 42\n\nFUNS = dict(fun=fun)\n")
+    setup.io_aux_file = str(aux_file)
+    funs = setup.gridded_aux_funs
+    assert list(funs) == ["fun"]
+    assert setup.gridded_aux_funs is funs
+    assert EvalSetup("proj", "exp2").gridded_aux_funs == {}
+
+
+def test_OutputPaths_get_json_output_dirs(tmp_path: Path):
+    paths = OutputPaths("proj", "exp", json_basedir=str(tmp_path))
+    out = paths.get_json_output_dirs(assert_exists=False)
+    assert list(out) == OutputPaths.JSON_SUBDIRS
+    assert not (tmp_path / "proj").exists()
+
+    (tmp_path / "proj" / "exp" / "ts").mkdir(parents=True)
+    out = paths.get_json_output_dirs()
+    for subdir, loc in out.items():
+        assert Path(loc) == tmp_path / "proj" / "exp" / subdir
+        assert Path(loc).is_dir()
@@ -1,3 +1,5 @@
+import os
+import stat
 from pathlib import Path
 
 import pytest
@@ -29,6 +31,22 @@ def test_reload_custom(
     assert path.exists()
     cache_handler.check_and_load(var_or_file_name=path.name, cache_dir=path.parent)
     assert cache_handler.loaded_data[path.name].shape == aeronetsunv3lev2_subset.shape
+    # data is written via temporary file, which is moved to the cache file
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_file_mode(
+    cache_handler: CacheHandlerUngridded, aeronetsunv3lev2_subset: UngriddedData, tmp_path: Path
+):
+    path = tmp_path / "test_file_mode.pkl"
+    umask = os.umask(0o022)
+    try:
+        cache_handler.write(
+            aeronetsunv3lev2_subset, var_or_file_name=path.name, cache_dir=path.parent
+        )
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
 
 
 @pytest.mark.dependency
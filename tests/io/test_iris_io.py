@@ -9,6 +9,7 @@ from iris import load
 from iris.cube import Cube, CubeList
 from iris.exceptions import TranslationError
 
+from pyaerocom import const
 from pyaerocom.exceptions import (
     FileConventionError,
     NetcdfError,
@@ -223,6 +224,24 @@ def test_load_cube_custom(file_path: Path, var_name: str | None):
     assert isinstance(cube, Cube)
 
 
+def test__check_set_netcdf_chunk_cache(monkeypatch):
+    import netCDF4
+
+    default = netCDF4.get_chunk_cache()
+    monkeypatch.setattr(iris_io, "_NC_CHUNK_CACHE_APPLIED", None)
+    try:
+        assert const.GRID_IO.NC_CHUNK_CACHE_SIZE is None
+        iris_io._check_set_netcdf_chunk_cache()
+        assert netCDF4.get_chunk_cache() == default
+
+        monkeypatch.setattr(const.GRID_IO, "NC_CHUNK_CACHE_SIZE", 64 * 1024**2)
+        iris_io._check_set_netcdf_chunk_cache()
+        size, nelems, _ = netCDF4.get_chunk_cache()
+        assert (size, nelems) == (64 * 1024**2, const.GRID_IO.NC_CHUNK_CACHE_NELEMS)
+    finally:
+        netCDF4.set_chunk_cache(*default)
+
+
 @pytest.mark.parametrize(
     "file,var_name,exception,error",
     [
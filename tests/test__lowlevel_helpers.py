@@ -9,6 +9,7 @@ from pyaerocom._lowlevel_helpers import (
     NestedContainer,
     check_dir_access,
     check_make_json,
+    check_write_access,
     invalid_input_err_str,
     read_json,
     round_floats,
@@ -102,6 +103,38 @@ def test_write_json(json_path: Path, data: dict, kwargs: dict):
     assert json_path.exists()
 
 
+def test_read_json_nan(json_path: Path):
+    json_path.write_text('{"bla": 42, "blub": NaN}')
+    data = read_json(json_path)
+    assert data["bla"] == 42
+    assert np.isnan(data["blub"])
+
+
+@pytest.mark.parametrize(
+    "data,result",
+    [
+        ({"bla": 42, "blub": np.nan}, {"bla": 42, "blub": None}),
+        ({"bla": np.float64(0.1234567), "blub": [np.float32(1)]}, {"bla": 0.12346, "blub": [1]}),
+    ],
+)
+def test_write_json_ignore_nan(json_path: Path, data: dict, result: dict):
+    write_json(data, json_path, ignore_nan=True)
+    assert read_json(json_path) == result
+
+
+def test_write_json_ignore_nan_indent(json_path: Path):
+    data = {"bla": {"blub": [1, 2.0, np.nan]}, 1: "int key"}
+    write_json(data, json_path, ignore_nan=True, indent=4)
+    assert read_json(json_path) == {"bla": {"blub": [1, 2.0, None]}, "1": "int key"}
+    assert len(json_path.read_text().splitlines()) > 1
+
+
+@pytest.mark.parametrize("indent", [2, 3, 4])
+def test_write_json_indent(json_path: Path, indent: int):
+    write_json({"bla": {"blub": 42}}, json_path, ignore_nan=True, indent=indent)
+    assert json_path.read_text().splitlines()[1] == " " * indent + '"bla": {'
+
+
 def test_write_json_error(json_path: Path):
     with pytest.raises(TypeError) as e:
         write_json({"bla": 42}, json_path, bla=42)
@@ -131,6 +164,16 @@ def test_check_dir_access(dir, val):
     assert check_dir_access(dir) == val
 
 
+def test_check_write_access(tmp_path: Path):
+    assert check_write_access(str(tmp_path))
+    assert not check_write_access(str(tmp_path / "bla"))
+    assert not check_write_access(tmp_path)
+    path = tmp_path / "file.txt"
+    path.write_text("bla")
+    assert not check_write_access(str(path))
+    assert list(tmp_path.iterdir()) == [path]
+
+
 def test_Constrainer():
     cont = Constrainer()
     assert cont.bla == 42
@@ -159,6 +202,16 @@ def test_ConstrainedContainer_update_error(kwargs):
         cont.update(**kwargs)
 
 
+@pytest.mark.parametrize(
+    "key,val", [("bla", True), ("opt", True), ("update", True), ("blaaaa", False), (42, False)]
+)
+def test_ConstrainedContainer__is_valid_key(key, val):
+    cont = Constrainer()
+    assert cont._is_valid_key(key) == val
+    if isinstance(key, str):
+        assert (key in dir(cont)) == val
+
+
 def test_NestedData_keys_unnested():
     cont = NestedData()
     keys = cont.keys_unnested()
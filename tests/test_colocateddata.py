@@ -355,6 +355,10 @@ def test_meta_access_filename():
     _meta = ColocatedData.get_meta_from_filename(name)
     assert _meta == meta
 
+    # cached parsing, make sure modifying output does not affect cache
+    _meta["model_var"] = "bla"
+    assert ColocatedData.get_meta_from_filename(f"/some/dir/{name}") == meta
+
 
 def test_read_colocated_data(coldata_tm5_aeronet):
     loaded = ColocatedData(EXAMPLE_FILE)
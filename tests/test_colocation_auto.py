@@ -41,6 +41,7 @@ default_setup = {
     "model_ts_type_read": None,
     "model_read_aux": {},
     "model_use_climatology": False,
+    "model_cast_float32": False,
     "gridded_reader_id": {"model": "ReadGridded", "obs": "ReadGridded"},
     "flex_ts_type": True,
     "min_num_obs": None,
@@ -102,6 +103,16 @@ def test_ColocationSetup_invalid_input(key, val, raises):
         assert stp[key] == val
 
 
+@pytest.mark.parametrize(
+    "start,stop,period",
+    [(2010, None, "2010"), (2010, 2012, "2010-2012"), ("2010-01-01", "2011-12-31", "2010-2011")],
+)
+def test_ColocationSetup__period_from_start_stop(start, stop, period: str):
+    stp = ColocationSetup(start=start, stop=stop)
+    assert stp._period_from_start_stop() == period
+    assert stp._period_from_start_stop() == period
+
+
 def test_Colocator__obs_vars__setter(col):
     col.obs_vars = "var"
     assert col.obs_vars == ["var"]
@@ -195,6 +206,20 @@ def test_Colocator_basedir_coldata(tmp_path: Path):
     assert not base_path.is_dir()
 
 
+def test_Colocator_get_nc_files_in_coldatadir(tmp_path: Path):
+    col = Colocator(raise_exceptions=True, basedir_coldata=tmp_path)
+    col.model_id = "model"
+    assert col.get_nc_files_in_coldatadir() == []
+    outdir = Path(col.output_dir)
+    for fname in ("a.nc", "b.nc", ".hidden.nc", "c.txt"):
+        (outdir / fname).touch()
+    files = col.get_nc_files_in_coldatadir()
+    assert sorted(Path(fp) for fp in files) == [outdir / "a.nc", outdir / "b.nc"]
+
+    (outdir / "b.nc").unlink()
+    assert col.get_nc_files_in_coldatadir() == [str(outdir / "a.nc")]
+
+
 def test_Colocator_update_basedir_coldata(tmp_path: Path):
     col = Colocator(raise_exceptions=True)
 
@@ -341,6 +366,31 @@ def test_colocator_get_model_data():
     assert isinstance(data, GriddedData)
 
 
+def test_colocator_get_model_data_cast_float32():
+    col = Colocator(raise_exceptions=True, model_cast_float32=True)
+    col.model_id = "TM5-met2010_CTRL-TEST"
+    data = col.get_model_data("od550aer")
+    assert data.cube.dtype == np.float32
+
+
+def test_colocator_clear_model_data_cache():
+    col = Colocator(raise_exceptions=True)
+    col.model_id = "TM5-met2010_CTRL-TEST"
+    col.model_use_vars = dict(abs550aer="od550aer")
+    col.get_model_data("od550aer")
+    col.clear_model_data_cache("abs550aer")
+    assert col._loaded_model_data == {}
+
+    col.get_model_data("od550aer")
+    col.model_rename_vars = dict(od550aer="MyAOD")
+    col.clear_model_data_cache("MyAOD")
+    assert col._loaded_model_data == {}
+
+    col.get_model_data("od550aer")
+    col.clear_model_data_cache()
+    assert col._loaded_model_data == {}
+
+
 def test_colocator__find_var_matches():
     col = Colocator()
     col.model_id = "TM5-met2010_CTRL-TEST"
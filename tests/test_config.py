@@ -57,6 +57,16 @@ def test_Config_ALL_DATABASE_IDS(empty_cfg):
     assert empty_cfg.ALL_DATABASE_IDS == ["metno", "users-db", "local-db"]
 
 
+def test_Config__is_ungridded_obs_id():
+    cfg = testmod.Config(try_infer_environment=False)
+    cfg.OBSLOCS_UNGRIDDED["obs1"] = "path"
+    cfg.OBS_UNGRIDDED_POST["obs2"] = {}
+    assert cfg.OBS_IDS_UNGRIDDED == ["obs1", "obs2"]
+    assert cfg._is_ungridded_obs_id("obs1")
+    assert cfg._is_ungridded_obs_id("obs2")
+    assert not cfg._is_ungridded_obs_id("obs3")
+
+
 @pytest.mark.parametrize(
     "file,try_infer_environment",
     [
@@ -137,6 +147,18 @@ def test_Config_read_config(cfg_id, basedir, init_obslocs_ungridded, init_data_s
     assert Path(cfg.CACHEDIR).exists()
 
 
+def test__read_config_ini(tmp_path: Path):
+    path = tmp_path / "paths.ini"
+    path.write_text("[outputfolders]\nOUTPUTDIR = /bla\n")
+    cr = testmod._read_config_ini(str(path))
+    assert cr["outputfolders"]["OUTPUTDIR"] == "/bla"
+    assert testmod._read_config_ini(str(path)) is cr
+
+    path.write_text("[outputfolders]\nOUTPUTDIR = /blaaaa\n")
+    cr = testmod._read_config_ini(str(path))
+    assert cr["outputfolders"]["OUTPUTDIR"] == "/blaaaa"
+
+
 def test_empty_class_header(empty_cfg):
     cfg = empty_cfg
     assert cfg.AERONET_SUN_V2L15_AOD_DAILY_NAME == "AeronetSunV2Lev1.5.daily"
@@ -293,6 +315,7 @@ def test_empty_init(empty_cfg):
 
     assert cfg._var_param is None
     assert cfg._coords is None
+    assert cfg._grid_io is None
 
     # Attributes that are used to store search directories
     assert cfg.OBSLOCS_UNGRIDDED == {}
@@ -308,6 +331,7 @@ def test_empty_init(empty_cfg):
 
     #: Settings for reading and writing of gridded data
     assert isinstance(cfg.GRID_IO, GridIO)
+    assert cfg.GRID_IO is cfg._grid_io
 
 
 def test_default_config_HOMEDIR():
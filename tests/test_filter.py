@@ -19,6 +19,16 @@ def test_filter_attributes():
     assert not f.region.is_htap()
 
 
+def test_Filter_spl():
+    f = Filter("EUROPE")
+    assert f.spl == ["EUROPE", "wMOUNTAINS"]
+    f.name = "noMOUNTAINS-OCN-NAMERICA"
+    assert f.spl == ["NAMERICA", "noMOUNTAINS", "OCN"]
+    assert f.region_name == "NAMERICA"
+    assert f.alt_range == Filter.ALTITUDE_FILTERS["noMOUNTAINS"]
+    assert f.land_ocn == "OCN"
+
+
 @pytest.mark.parametrize(
     "filter_name, mean",
     [